@@ -1,112 +1,96 @@
 import datetime as dt
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import time
 from logging import Logger
-from typing import Any, Dict, List
-
-import rich
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
 
 from llmvm.common.container import Container
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.traceback import install
 
 
-def detect_terminal_background():
-    """Detect if terminal has dark or light background"""
-    # Check for forced theme first
-    forced_theme = os.environ.get("LLMVM_FORCE_THEME", "").lower()
-    if forced_theme in ("light", "dark"):
-        return forced_theme
+def _theme_from_rgb(r: int, g: int, b: int, max_value: int) -> str:
+    # Calculate luminance using relative luminance formula
+    # Convert to 0-1 range and apply gamma correction
+    r_norm = (r / max_value) ** 2.2
+    g_norm = (g / max_value) ** 2.2
+    b_norm = (b / max_value) ** 2.2
+    luminance = 0.2126 * r_norm + 0.7152 * g_norm + 0.0722 * b_norm
+    # If luminance > 0.5, it's a light background
+    return 'light' if luminance > 0.5 else 'dark'
 
-    # Try to detect terminal background using various methods
 
-    # Method 1: Check COLORFGBG environment variable (common in many terminals)
-    colorfgbg = os.environ.get("COLORFGBG", "")
-    if colorfgbg:
-        # Format is usually "foreground;background" where higher numbers = lighter
-        parts = colorfgbg.split(";")
-        if len(parts) >= 2:
-            try:
-                bg = int(parts[-1])
-                # In COLORFGBG, 0-7 are typically dark backgrounds, 8-15 are light
-                return "light" if bg >= 8 else "dark"
-            except ValueError:
-                pass
+_OSC11_RESPONSE = re.compile(rb'\x1b\]11;rgb:([0-9a-fA-F]{1,4})/([0-9a-fA-F]{1,4})/([0-9a-fA-F]{1,4})')
+_DA1_RESPONSE = re.compile(rb'\x1b\[\?[0-9;]*c')
 
-    # Method 2: Apple Terminal - use AppleScript to get actual background color
-    term_program = os.environ.get("TERM_PROGRAM", "")
-    if term_program == "Apple_Terminal":
-        try:
-            import subprocess
 
-            script = 'tell application "Terminal" to get background color of selected tab of window 1'
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=2,
-            )
-            # Parse RGB values (16-bit format: 0-65535)
-            colors = result.stdout.strip().split(", ")
-            if len(colors) == 3:
-                r, g, b = [int(c) for c in colors]
-                # Calculate luminance using relative luminance formula
-                # Convert to 0-1 range and apply gamma correction
-                r_norm = (r / 65535) ** 2.2
-                g_norm = (g / 65535) ** 2.2
-                b_norm = (b / 65535) ** 2.2
-                luminance = 0.2126 * r_norm + 0.7152 * g_norm + 0.0722 * b_norm
-                # If luminance > 0.5, it's a light background
-                return "light" if luminance > 0.5 else "dark"
-        except Exception:
-            # Fall back to other methods if AppleScript fails
-            pass
-
-    # Method 3: Check terminal program names that typically default to light/dark
-    if "iterm" in term_program.lower():
-        # iTerm2 usually defaults to dark, but we can't know for sure
-        return "dark"
+@functools.lru_cache(maxsize=None)
+def _query_osc11_background(timeout: float = 0.1) -> Optional[str]:
+    """Query the terminal background color with OSC 11, followed by a DA1 request.
 
-    # Method 4: Check if running in VS Code terminal (often light)
-    if (
-        os.environ.get("VSCODE_INJECTION")
-        or "code" in os.environ.get("TERM_PROGRAM", "").lower()
-    ):
-        return "light"
+    Every terminal answers DA1, so a DA1 reply without a preceding OSC 11 reply
+    means the terminal doesn't support the query and we can bail out immediately.
+    The query is skipped if the user has already typed ahead, and a reply that
+    misses the timeout is flushed so it doesn't leak into the next prompt.
+    Returns 'light', 'dark', or None if the background couldn't be determined.
+    """
+    try:
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            return None
 
-    # Default to dark theme (most terminals default to dark)
-    return "dark"
+        import select
+        import termios
+        import tty
 
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+    except Exception:
+        return None
 
-def get_theme_colors():
-    """Get color scheme based on terminal background"""
-    theme = detect_terminal_background()
-
-    if theme == "light":
-        return {
-            "client_stream_token_color": "dim",  # Dark gray for light backgrounds
-            "client_stream_thinking_token_color": "blue",  # Blue for light backgrounds
-            "client_role_color": "bold blue",  # Blue instead of cyan
-            "client_repl_color": "blue",  # Blue instead of bright cyan
-            "client_assistant_color": "default",  # Default text for better compatibility
-            "client_info_color": "blue",  # Blue for info text
-            "client_info_bold_color": "bold blue",  # Bold blue for emphasis
-        }
-    else:
-        return {
-            "client_stream_token_color": "dim",  # Light gray for dark backgrounds
-            "client_stream_thinking_token_color": "gray",  # Original blue-gray
-            "client_role_color": "bold bright_blue",  # Bright blue instead of cyan
-            "client_repl_color": "ansibrightblue",  # Bright blue instead of bright cyan
-            "client_assistant_color": "default",  # Default text for better compatibility
-            "client_info_color": "bold green",  # Green for info text
-            "client_info_bold_color": "bright_blue",  # Bright blue for emphasis
-        }
+    response = b''
+    complete = False
+    try:
+        tty.setraw(fd, termios.TCSANOW)
+        # don't interleave the reply with (or swallow) pending typeahead
+        if select.select([fd], [], [], 0)[0]:
+            complete = True
+            return None
+
+        sys.stdout.write('\x1b]11;?\x07\x1b[c')
+        sys.stdout.flush()
+
+        deadline = time.monotonic() + timeout
+        while not (complete := bool(_DA1_RESPONSE.search(response))):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            chunk = os.read(fd, 1024)
+            if not chunk:
+                break
+            response += chunk
+    except Exception:
+        return None
+    finally:
+        if not complete:
+            # drop whatever part of the reply has arrived; the rest would
+            # otherwise show up as garbage input
+            termios.tcflush(fd, termios.TCIFLUSH)
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+    match = _OSC11_RESPONSE.search(response)
+    if not match:
+        return None
+
+    # components are 1-4 hex digits each, scaled to the digit count
+    r, g, b = (int(c, 16) for c in match.groups())
+    return _theme_from_rgb(r, g, b, 16 ** len(match.group(1)) - 1)
 
 
 def detect_terminal_background():
@@ -131,7 +115,12 @@ def detect_terminal_background():
             except ValueError:
                 pass
 
-    # Method 2: Apple Terminal - use AppleScript to get actual background color
+    # Method 2: ask the terminal directly via an OSC 11 background color query
+    osc_theme = _query_osc11_background()
+    if osc_theme:
+        return osc_theme
+
+    # Method 3: Apple Terminal - use AppleScript to get actual background color
     term_program = os.environ.get('TERM_PROGRAM', '')
     if term_program == 'Apple_Terminal':
         try:
@@ -148,24 +137,17 @@ def detect_terminal_background():
             colors = result.stdout.strip().split(', ')
             if len(colors) == 3:
                 r, g, b = [int(c) for c in colors]
-                # Calculate luminance using relative luminance formula
-                # Convert to 0-1 range and apply gamma correction
-                r_norm = (r / 65535) ** 2.2
-                g_norm = (g / 65535) ** 2.2
-                b_norm = (b / 65535) ** 2.2
-                luminance = 0.2126 * r_norm + 0.7152 * g_norm + 0.0722 * b_norm
-                # If luminance > 0.5, it's a light background
-                return 'light' if luminance > 0.5 else 'dark'
+                return _theme_from_rgb(r, g, b, 65535)
         except Exception:
             # Fall back to other methods if AppleScript fails
             pass
 
-    # Method 3: Check terminal program names that typically default to light/dark
+    # Method 4: Check terminal program names that typically default to light/dark
     if 'iterm' in term_program.lower():
         # iTerm2 usually defaults to dark, but we can't know for sure
         return 'dark'
 
-    # Method 4: Check if running in VS Code terminal (often light)
+    # Method 5: Check if running in VS Code terminal (often light)
     if os.environ.get('VSCODE_INJECTION') or 'code' in os.environ.get('TERM_PROGRAM', '').lower():
         return 'light'
 
@@ -173,76 +155,92 @@ def detect_terminal_background():
     return 'dark'
 
 
+_LIGHT_THEME = MappingProxyType({
+    'client_stream_token_color': '#333333',      # Dark gray for light backgrounds
+    'client_stream_thinking_token_color': '#0066cc',  # Blue for light backgrounds
+    'client_role_color': 'bold blue',            # Blue instead of cyan
+    'client_repl_color': 'blue',                 # Blue instead of bright cyan
+    'client_assistant_color': 'black',          # Black text for light backgrounds
+    'client_info_color': 'blue',                # Blue for info text
+    'client_info_bold_color': 'bold blue'       # Bold blue for emphasis
+})
+
+_DARK_THEME = MappingProxyType({
+    'client_stream_token_color': '#dddddd',      # Light gray for dark backgrounds
+    'client_stream_thinking_token_color': '#5f819d',  # Original blue-gray
+    'client_role_color': 'bold cyan',            # Original cyan
+    'client_repl_color': 'ansibrightcyan',      # Original bright cyan
+    'client_assistant_color': 'white',          # White text for dark backgrounds
+    'client_info_color': 'bold green',          # Green for info text
+    'client_info_bold_color': 'cyan'            # Cyan for emphasis
+})
+
+
 def get_theme_colors():
     """Get color scheme based on terminal background"""
-    theme = detect_terminal_background()
-
-    if theme == 'light':
-        return {
-            'client_stream_token_color': '#333333',      # Dark gray for light backgrounds
-            'client_stream_thinking_token_color': '#0066cc',  # Blue for light backgrounds
-            'client_role_color': 'bold blue',            # Blue instead of cyan
-            'client_repl_color': 'blue',                 # Blue instead of bright cyan
-            'client_assistant_color': 'black',          # Black text for light backgrounds
-            'client_info_color': 'blue',                # Blue for info text
-            'client_info_bold_color': 'bold blue'       # Bold blue for emphasis
-        }
-    else:
-        return {
-            'client_stream_token_color': '#dddddd',      # Light gray for dark backgrounds
-            'client_stream_thinking_token_color': '#5f819d',  # Original blue-gray
-            'client_role_color': 'bold cyan',            # Original cyan
-            'client_repl_color': 'ansibrightcyan',      # Original bright cyan
-            'client_assistant_color': 'white',          # White text for dark backgrounds
-            'client_info_color': 'bold green',          # Green for info text
-            'client_info_bold_color': 'cyan'            # Cyan for emphasis
-        }
+    return _LIGHT_THEME if detect_terminal_background() == 'light' else _DARK_THEME
+
+
+_config_cache: Dict[str, Any] = {}
+
+
+def _config(key: str, default: Any = "") -> Any:
+    # config values don't change after process start, so resolve each key once
+    if key not in _config_cache:
+        _config_cache[key] = Container.get_config_variable(key, default=default) or default
+    return _config_cache[key]
 
 
+_TRACE_ENABLED = bool(_config("LLMVM_EXECUTOR_TRACE"))
+_SERIALIZE_ENABLED = bool(_config("LLMVM_SERIALIZE"))
 
 
 def __trace(content):
     try:
-        if Container.get_config_variable("LLMVM_EXECUTOR_TRACE", default=""):
-            with open(
-                os.path.expanduser(
-                    Container.get_config_variable("LLMVM_EXECUTOR_TRACE")
-                ),
-                "a+",
-            ) as f:
+        if _TRACE_ENABLED:
+            with open(os.path.expanduser(_config("LLMVM_EXECUTOR_TRACE")), "a+") as f:
                 f.write(content)
     except Exception as e:
+        import rich
         rich.print(f"Error tracing: {e}")
 
 
+_role_tags: Dict[str, tuple[str, str]] = {}
+
+
+def _role_tag(role: str) -> tuple[str, str]:
+    tags = _role_tags.get(role)
+    if tags is None:
+        capitalized = role.capitalize()
+        tags = _role_tags[role] = (f"<{capitalized}:>", f"</{capitalized}>\n\n")
+    return tags
+
+
 def messages_trace(messages: List[Dict[str, Any]]):
-    if Container.get_config_variable("LLMVM_EXECUTOR_TRACE", default=""):
+    if _TRACE_ENABLED:
+        out = []
         for m in messages:
             if "content" in m:
-                __trace(
-                    f"<{m['role'].capitalize()}:>{m['content']}</{m['role'].capitalize()}>\n\n"
-                )
-            elif (
-                "parts" in m
-                and isinstance(m["parts"], list)
-                and isinstance(m["parts"][0], dict)
-                and "inline_data" in m["parts"][0]
-            ):
-                # ImageContent todo fix properly
-                __trace(
-                    f"<{m['role'].capitalize()}:>[ImageContent()]</{m['role'].capitalize()}>\n\n"
-                )
+                body = m["content"]
             elif "parts" in m:
-                content = " ".join(m["parts"])
-                __trace(
-                    f"<{m['role'].capitalize()}:>{content}</{m['role'].capitalize()}>\n\n"
-                )
+                parts = m["parts"]
+                if isinstance(parts, list) and isinstance(parts[0], dict) and "inline_data" in parts[0]:
+                    # ImageContent todo fix properly
+                    body = "[ImageContent()]"
+                else:
+                    body = " ".join(parts)
+            else:
+                continue
+            tag_open, tag_close = _role_tag(m["role"])
+            out.append(f"{tag_open}{body}{tag_close}")
+        if out:
+            __trace("".join(out))
 
 
 def serialize_messages(messages):
-    if Container.get_config_variable("LLMVM_SERIALIZE", default=""):
+    if _SERIALIZE_ENABLED:
         result = json.dumps([m.to_json() for m in messages], indent=2)
-        file_path = os.path.expanduser(Container.get_config_variable("LLMVM_SERIALIZE"))
+        file_path = os.path.expanduser(_config("LLMVM_SERIALIZE"))
         with open(file_path, "a+") as f:
             f.write(result + "\n\n")
             f.flush()
@@ -251,62 +249,111 @@ def serialize_messages(messages):
 class TimedLogger(logging.Logger):
     def __init__(self, name="timing", level=logging.NOTSET):
         super().__init__(name, level)
-        self._start_time = None
+        self._start_time_ns = None
         self._intermediate_timings = {}
         self._prepend = ""
 
     def start(self, prepend=""):
-        self._start_time = time.time()
+        self._start_time_ns = time.perf_counter_ns()
         self._intermediate_timings.clear()  # Clear previous intermediate timings
         self._prepend = prepend
 
     def save_intermediate(self, label):
-        if self._start_time is None:
+        # timing is disabled (level CRITICAL) by default, so keep this path near-free
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+
+        if self._start_time_ns is None:
             self.warning("Timer was not started!")
             return
 
         if label in self._intermediate_timings:
             return
 
-        current_time = time.time()
-        elapsed_time = (
-            current_time - self._start_time
-        ) * 1000  # Convert to milliseconds
-        self._intermediate_timings[label] = elapsed_time
-        self.debug(f"'{label}' timing: {elapsed_time:.2f} ms {self._prepend}")
+        elapsed_ns = time.perf_counter_ns() - self._start_time_ns
+        self._intermediate_timings[label] = elapsed_ns
+        self.debug(f"'{label}' timing: {elapsed_ns / 1e6:.2f} ms {self._prepend}")
 
     def end(self, message="Elapsed time"):
-        if self._start_time is None:
+        if not self.isEnabledFor(logging.DEBUG):
+            self._start_time_ns = None
+            return
+
+        if self._start_time_ns is None:
             self.warning("Timer was not started!")
             return
-        elapsed_time = (
-            time.time() - self._start_time
-        ) * 1000  # Convert to milliseconds
-        self.debug(f"{message}: {elapsed_time:.2f} ms {self._prepend}")
+        elapsed_ns = time.perf_counter_ns() - self._start_time_ns
+        self.debug(f"{message}: {elapsed_ns / 1e6:.2f} ms {self._prepend}")
         # Optionally, log intermediate timings at the end
-        for label, timing in self._intermediate_timings.items():
-            self.debug(f"'{label}' timing: {timing:.2f} ms {self._prepend}")
-        self._start_time = None
+        for label, timing_ns in self._intermediate_timings.items():
+            self.debug(f"'{label}' timing: {timing_ns / 1e6:.2f} ms {self._prepend}")
+        self._start_time_ns = None
         self._intermediate_timings.clear()
 
 
+# third party loggers quietened by setup_logging()
+_QUIET_LOGGERS = (
+    ("asyncio", logging.WARNING),
+    ("markdown_it", logging.WARNING),
+    ("numexpr", logging.WARNING),
+    ("requests", logging.WARNING),
+    ("openai", logging.WARNING),
+    ("pdfminer", logging.WARNING),
+    ("urllib3", logging.WARNING),
+    ("parso", logging.WARNING),
+    ("httpx", logging.WARNING),
+    ("httpcore", logging.WARNING),
+    ("PIL.PngImagePlugin", logging.CRITICAL),
+    ("PIL", logging.CRITICAL),
+    ("anthropic", logging.WARNING),
+    ("grpc", logging.WARNING),
+    ("matplotlib", logging.WARNING),
+    ("matplotlib.font_manager", logging.WARNING),
+    ("dateparser", logging.CRITICAL),
+    ("tesseract", logging.CRITICAL),
+    ("pytesseract", logging.CRITICAL),
+    ("tzlocal", logging.CRITICAL),
+    ("botocore", logging.WARNING),
+    ("transformers", logging.CRITICAL),
+    ("transformers.utils.import_utils", logging.ERROR),
+)
+
+# loggers silenced by suppress_logging()
+_SUPPRESSED_LOGGERS = (
+    ("root", logging.CRITICAL),
+    ("asyncio", logging.CRITICAL),
+    ("markdown_it", logging.CRITICAL),
+    ("numexpr", logging.CRITICAL),
+    ("rich", logging.CRITICAL),
+    ("httpx", logging.CRITICAL),
+    ("httpcore", logging.CRITICAL),
+    ("PIL.PngImagePlugin", logging.WARNING),
+    ("PIL", logging.WARNING),
+    ("anthropic", logging.WARNING),
+    ("grpc", logging.WARNING),
+    ("matplotlib", logging.WARNING),
+    ("matplotlib.font_manager", logging.WARNING),
+    ("transformers", logging.CRITICAL),
+)
+
 timing = TimedLogger()
 global_loggers: Dict[str, Logger] = {}
-handler = RichHandler()
 
-if not os.path.exists(
-    Container.get_config_variable("log_directory", default="~/.local/share/llmvm/logs")
-):
-    os.makedirs(
-        Container.get_config_variable(
-            "log_directory", default="~/.local/share/llmvm/logs"
-        )
-    )
+os.makedirs(os.path.expanduser(_config("log_directory", default="~/.local/share/llmvm/logs")), exist_ok=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    # rich is imported lazily to keep it off the import path of this module;
+    # stderr=True (rather than file=sys.stderr) makes rich look up sys.stderr on
+    # every write, so redirecting stderr later still works with the cached console
+    from rich.console import Console
+    return Console(stderr=True)
 
 
 def no_indent_debug(logger, message) -> None:
     if logger.level <= logging.DEBUG:
-        console = Console(file=sys.stderr)
+        console = _get_console()
         console.print(message)
 
 
@@ -332,7 +379,7 @@ def role_debug(logger, callee, role, message) -> None:
         if callee.startswith("prompts/"):
             callee = callee.replace("prompts/", "")
 
-        console = Console(file=sys.stderr)
+        console = _get_console()
         width, _ = console.size
         callee_column = 20
         role_column = 10
@@ -343,34 +390,27 @@ def role_debug(logger, callee, role, message) -> None:
         header = True
         counter = 1
         max_lines = 20
+        indent = "".ljust(callee_column) + "".ljust(role_column)
         try:
+            from rich.text import Text
+
+            # assemble every line up front and hand rich a single renderable,
+            # rather than running the markup parser once per line
+            lines = []
             for message in message_lines:
                 if header:
-                    console.print(
-                        "[orange]{}[/orange][green]{}[/green][grey]{}[/grey]".format(
-                            callee[0 : callee_column - 1].ljust(callee_column)[
-                                :callee_column
-                            ],
-                            role.ljust(role_column)[:role_column],
-                            message.ljust(text_column)[:text_column],
-                        )
-                    )
+                    lines.append(Text.assemble(
+                        (callee[0 : callee_column - 1].ljust(callee_column)[:callee_column], "orange"),
+                        (role.ljust(role_column)[:role_column], "green"),
+                        (message.ljust(text_column)[:text_column], "grey"),
+                    ))
                     header = False
                 elif counter < max_lines or counter >= len(message_lines) - 5:
-                    console.print(
-                        "{}{}{}".format(
-                            "".ljust(callee_column),
-                            "".ljust(role_column),
-                            message.ljust(text_column)[:text_column],
-                        )
-                    )
+                    lines.append(Text(indent + message.ljust(text_column)[:text_column]))
                 elif counter == max_lines:
-                    console.print(
-                        "{}{}{}".format(
-                            "".ljust(callee_column), "".ljust(role_column), "..."
-                        )
-                    )
+                    lines.append(Text(indent + "..."))
                 counter += 1
+            console.print(Text("\n").join(lines))
         except Exception as _:
             pass
 
@@ -380,47 +420,23 @@ def setup_logging(
     default_level=logging.DEBUG,
     enable_timing=False,
 ):
-    logging.getLogger("asyncio").setLevel(logging.WARNING)
-    logging.getLogger("markdown_it").setLevel(logging.WARNING)
-    logging.getLogger("numexpr").setLevel(logging.WARNING)
-    logging.getLogger("requests").setLevel(logging.WARNING)
-    logging.getLogger("openai").setLevel(logging.WARNING)
-    logging.getLogger("pdfminer").setLevel(logging.WARNING)
-    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    for name, level in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(level)
     logging.getLogger("parso.python.diff").disabled = True
-    logging.getLogger("parso").setLevel(logging.WARNING)
-    logging.getLogger("httpx").setLevel(logging.WARNING)
-    logging.getLogger("httpcore").setLevel(logging.WARNING)
-    logging.getLogger("PIL.PngImagePlugin").setLevel(logging.CRITICAL)
-    logging.getLogger("PIL").setLevel(logging.CRITICAL)
-    logging.getLogger("anthropic").setLevel(logging.WARNING)
-    logging.getLogger("grpc").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib.font_manager").setLevel(logging.WARNING)
-    logging.getLogger("dateparser").setLevel(logging.CRITICAL)
-    logging.getLogger("tesseract").setLevel(logging.CRITICAL)
-    logging.getLogger("pytesseract").setLevel(logging.CRITICAL)
-    logging.getLogger("tzlocal").setLevel(logging.CRITICAL)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("transformers").setLevel(logging.CRITICAL)
-    logging.getLogger("transformers.utils.import_utils").setLevel(logging.ERROR)
 
     logger: Logger = logging.getLogger()
 
-    handlers_to_remove = [
-        handler
-        for handler in logger.handlers
-        if isinstance(handler, logging.StreamHandler)
-    ]
-    for handler in handlers_to_remove:
-        logger.removeHandler(handler)
+    logger.handlers[:] = [h for h in logger.handlers if not isinstance(h, logging.StreamHandler)]
 
     if module_name in global_loggers:
         return global_loggers[module_name]
 
+    from rich.logging import RichHandler
+    from rich.traceback import install
+
     install(show_locals=False, max_frames=20, suppress=["importlib, site-packages"])
     handler = RichHandler(
-        console=Console(file=sys.stderr),
+        console=_get_console(),
         show_time=True,
         show_level=True,
         show_path=False,
@@ -436,11 +452,7 @@ def setup_logging(
     logger.addHandler(handler)
 
     if enable_timing:
-        handlers_to_remove = [
-            h for h in timing.handlers if isinstance(handler, logging.StreamHandler)
-        ]
-        for h in handlers_to_remove:
-            timing.removeHandler(h)
+        timing.handlers[:] = [h for h in timing.handlers if not isinstance(h, logging.StreamHandler)]
 
         timing.setLevel(default_level)
         timing.addHandler(handler)
@@ -453,20 +465,8 @@ def setup_logging(
 
 def suppress_logging():
     logging.getLogger().setLevel(logging.CRITICAL)
-    logging.getLogger("root").setLevel(logging.CRITICAL)
-    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
-    logging.getLogger("markdown_it").setLevel(logging.CRITICAL)
-    logging.getLogger("numexpr").setLevel(logging.CRITICAL)
-    logging.getLogger("rich").setLevel(logging.CRITICAL)
-    logging.getLogger("httpx").setLevel(logging.CRITICAL)
-    logging.getLogger("httpcore").setLevel(logging.CRITICAL)
-    logging.getLogger("PIL.PngImagePlugin").setLevel(logging.WARNING)
-    logging.getLogger("PIL").setLevel(logging.WARNING)
-    logging.getLogger("anthropic").setLevel(logging.WARNING)
-    logging.getLogger("grpc").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib").setLevel(logging.WARNING)
-    logging.getLogger("matplotlib.font_manager").setLevel(logging.WARNING)
-    logging.getLogger("transformers").setLevel(logging.CRITICAL)
+    for name, level in _SUPPRESSED_LOGGERS:
+        logging.getLogger(name).setLevel(level)
 
 
 def get_timer():
@@ -5,11 +5,17 @@ Bash Helper for LLMVM - Provides safe bash command execution with approval and s
 Inspired by query-muse's sophisticated sandbox and approval system.
 """
 
+import functools
 import os
+import re
+import select
 import shlex
 import subprocess
 import time
 import signal
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Optional, List, Set
 import sys
@@ -20,7 +26,7 @@ from llmvm.common.container import Container
 logging = setup_logging()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BashResult:
     """Result of executing a bash command."""
     stdout: str
@@ -34,84 +40,167 @@ class BashResult:
     def get_str(self) -> str:
         """Return stdout and stderr (if present) for use with result()."""
         if self.stderr:
-            return f"{self.stdout}\nSTDERR:\n{self.stderr}"
+            return "".join((self.stdout, "\nSTDERR:\n", self.stderr))
         return self.stdout
 
 
+_VERDICT_CACHE_SIZE = 1024
+
+_DEFAULT_KNOWN_SAFE_COMMANDS = (
+    'ls', 'cat', 'head', 'tail', 'grep', 'find', 'pwd', 'echo',
+    'which', 'whereis', 'date', 'whoami', 'id', 'uname', 'uptime'
+)
+
+_DEFAULT_DANGEROUS_COMMANDS = (
+    'rm', 'rmdir', 'mv', 'cp', 'dd', 'mkfs', 'fdisk', 'mount',
+    'umount', 'chmod', 'chown', 'su', 'sudo', 'passwd'
+)
+
+
+def _first_token(command: str) -> Optional[str]:
+    """
+    Extract the first word of a command without a full shlex parse.
+
+    Only the leading token matters for the safety checks, so a quoted first
+    word standing on its own is unwrapped and anything else is a plain
+    whitespace split. A quoted word glued to more text (e.g. 'ls';rm) falls
+    back to shlex so the whole word is judged, not just the quoted part.
+    Raises ValueError on invalid shell syntax.
+    """
+    command = command.lstrip()
+    if not command:
+        return None
+
+    quote = command[0]
+    if quote in ('"', "'"):
+        end = command.find(quote, 1)
+        if end != -1 and (end + 1 == len(command) or command[end + 1].isspace()):
+            return command[1:end]
+        return shlex.split(command)[0]
+    return command.split(None, 1)[0]
+
+
+# shared by is_known_safe and needs_approval; LLM generated commands repeat a lot
+@functools.lru_cache(maxsize=4096)
+def _base_command(command: str) -> Optional[str]:
+    """Base name of the executable a command runs, or None if it can't be determined."""
+    try:
+        token = _first_token(command)
+    except ValueError:
+        # Invalid shell syntax
+        return None
+    if not token:
+        return None
+    return os.path.basename(token)
+
+# Substrings that need approval wherever they appear in a command line, e.g. after
+# a pipe or && that follows an otherwise trusted command
+_DEFAULT_DANGEROUS_PATTERNS = (
+    'rm -rf /', 'rm -fr /', '--no-preserve-root', '| sh', '|sh', '| bash', '|bash',
+    '> /dev/sd', 'of=/dev/', 'mkfs', ':(){', 'chmod -R 777 /'
+)
+
+
+def _compile_patterns(patterns) -> re.Pattern:
+    """Single alternation regex so all patterns are screened in one pass over the command."""
+    return re.compile('|'.join(re.escape(p) for p in patterns))
+
+
+_DANGEROUS_RE = _compile_patterns(_DEFAULT_DANGEROUS_PATTERNS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_bash_config() -> dict:
+    """Load the bash_helper config section once per process."""
+    try:
+        container = Container(throw=False)
+        # Check if container was properly initialized
+        if hasattr(container, 'configuration'):
+            return container.get('bash_helper', {}) or {}
+        return {}  # No config file available
+    except (ValueError, FileNotFoundError):
+        # Fallback to defaults if config is not available
+        return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_safety_assessor() -> 'CommandSafetyAssessor':
+    """Shared CommandSafetyAssessor built from the cached config."""
+    return CommandSafetyAssessor(_get_bash_config())
+
+
 class CommandSafetyAssessor:
     """Assesses the safety of bash commands."""
 
-    def __init__(self):
-        """Initialize with configuration."""
-        try:
-            container = Container(throw=False)
-            # Check if container was properly initialized
-            if hasattr(container, 'configuration'):
-                config = container.get('bash_helper', {})
-            else:
-                config = {}  # No config file available
-
-            # Load safe commands from config, with fallback defaults
-            self.known_safe_commands = set(config.get('known_safe_commands', [
-                'ls', 'cat', 'head', 'tail', 'grep', 'find', 'pwd', 'echo',
-                'which', 'whereis', 'date', 'whoami', 'id', 'uname', 'uptime'
-            ]))
-
-            # Load dangerous commands from config, with fallback defaults
-            self.dangerous_commands = set(config.get('dangerous_commands', [
-                'rm', 'rmdir', 'mv', 'cp', 'dd', 'mkfs', 'fdisk', 'mount',
-                'umount', 'chmod', 'chown', 'su', 'sudo', 'passwd'
-            ]))
-
-        except (ValueError, FileNotFoundError):
-            # Fallback to defaults if config is not available
-            self.known_safe_commands = {
-                'ls', 'cat', 'head', 'tail', 'grep', 'find', 'pwd', 'echo',
-                'which', 'whereis', 'date', 'whoami', 'id', 'uname', 'uptime'
-            }
-            self.dangerous_commands = {
-                'rm', 'rmdir', 'mv', 'cp', 'dd', 'mkfs', 'fdisk', 'mount',
-                'umount', 'chmod', 'chown', 'su', 'sudo', 'passwd'
-            }
+    def __init__(self, config: Optional[dict] = None):
+        """Initialize with configuration (loaded from the container if not given)."""
+        if config is None:
+            config = _get_bash_config()
+
+        # Load safe/dangerous commands from config, with fallback defaults
+        self.known_safe_commands = frozenset(config.get('known_safe_commands', _DEFAULT_KNOWN_SAFE_COMMANDS))
+        self.dangerous_commands = frozenset(config.get('dangerous_commands', _DEFAULT_DANGEROUS_COMMANDS))
+        self.dangerous_pattern = (
+            _compile_patterns(config['dangerous_patterns']) if config.get('dangerous_patterns') else _DANGEROUS_RE
+        )
+
+        # verdicts are a pure function of the command string, so remember recent ones
+        self._safe_cache: OrderedDict[str, bool] = OrderedDict()
+        self._approval_cache: OrderedDict[str, bool] = OrderedDict()
+        # the shared assessor is used from the runtime's worker threads
+        self._cache_lock = threading.Lock()
+
+    def _cached_verdict(self, cache: OrderedDict, command: str) -> Optional[bool]:
+        with self._cache_lock:
+            verdict = cache.get(command)
+            if verdict is not None:
+                cache.move_to_end(command)
+            return verdict
+
+    def _cache_verdict(self, cache: OrderedDict, command: str, verdict: bool) -> bool:
+        with self._cache_lock:
+            cache[command] = verdict
+            if len(cache) > _VERDICT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return verdict
 
     def is_known_safe(self, command: str) -> bool:
         """Check if a command is known to be safe for auto-approval."""
-        try:
-            # Parse the command to get the base command
-            tokens = shlex.split(command)
-            if not tokens:
-                return False
-
-            base_command = os.path.basename(tokens[0])
-            return base_command in self.known_safe_commands
+        verdict = self._cached_verdict(self._safe_cache, command)
+        if verdict is not None:
+            return verdict
 
-        except ValueError:
-            # Invalid shell syntax
-            return False
+        base_command = _base_command(command)
+        if base_command is None or self.dangerous_pattern.search(command):
+            # Empty command, invalid shell syntax, or a dangerous pattern somewhere in the line
+            return self._cache_verdict(self._safe_cache, command, False)
+        return self._cache_verdict(self._safe_cache, command, base_command in self.known_safe_commands)
 
     def needs_approval(self, command: str) -> bool:
         """Check if a command needs explicit approval."""
-        try:
-            tokens = shlex.split(command)
-            if not tokens:
-                return True
+        verdict = self._cached_verdict(self._approval_cache, command)
+        if verdict is not None:
+            return verdict
 
-            base_command = os.path.basename(tokens[0])
+        base_command = _base_command(command)
+        if base_command is None:
+            # Empty command or invalid shell syntax, needs approval
+            return self._cache_verdict(self._approval_cache, command, True)
 
-            # If it's a known safe command, no approval needed
-            if base_command in self.known_safe_commands:
-                return False
+        # Dangerous patterns anywhere in the line need approval, even after a safe command
+        if self.dangerous_pattern.search(command):
+            return self._cache_verdict(self._approval_cache, command, True)
 
-            # If it's a known dangerous command, definitely needs approval
-            if base_command in self.dangerous_commands:
-                return True
+        # If it's a known safe command, no approval needed
+        if base_command in self.known_safe_commands:
+            return self._cache_verdict(self._approval_cache, command, False)
 
-            # For unknown commands, err on the side of caution
-            return True
+        # If it's a known dangerous command, definitely needs approval
+        if base_command in self.dangerous_commands:
+            return self._cache_verdict(self._approval_cache, command, True)
 
-        except ValueError:
-            # Invalid shell syntax, needs approval
-            return True
+        # For unknown commands, err on the side of caution
+        return self._cache_verdict(self._approval_cache, command, True)
 
 
 class ApprovalSystem:
@@ -119,17 +208,7 @@ class ApprovalSystem:
 
     def __init__(self):
         """Initialize with configuration."""
-        try:
-            container = Container(throw=False)
-            # Check if container was properly initialized
-            if hasattr(container, 'configuration'):
-                config = container.get('bash_helper', {})
-            else:
-                config = {}  # No config file available
-            self.session_approvals = config.get('session_approvals', True)
-        except (ValueError, FileNotFoundError):
-            self.session_approvals = True
-
+        self.session_approvals = _get_bash_config().get('session_approvals', True)
         self.approved_commands: Set[str] = set()  # Session-persistent approvals
 
     def request_approval(self, command: str, cwd: str, justification: str = None) -> bool:
@@ -183,6 +262,291 @@ class ApprovalSystem:
                 return False
 
 
+def _decode_output(data: bytes) -> str:
+    # match text=True: decode and translate universal newlines
+    return data.decode(errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _kill_process_group(proc) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+    proc.wait()
+
+
+# posix_spawn keeps the child from duplicating a large server's address space on Linux
+_USE_POSIX_SPAWN = sys.platform.startswith('linux') and hasattr(os, 'posix_spawn')
+
+
+class _PosixSpawnedShell:
+    """
+    /bin/sh -c child started with os.posix_spawn, exposing the small slice of the
+    Popen interface _run_process and _kill_process_group use.
+
+    posix_spawn has no cwd argument, so the script changes directory itself.
+    """
+
+    def __init__(self, command: str, cwd: str):
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        # same line as the command so shell error messages keep their line numbers
+        script = f"cd -- {shlex.quote(cwd)} || exit 1; {command}"
+        try:
+            self.pid = os.posix_spawn(
+                '/bin/sh',
+                ['/bin/sh', '-c', script],
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, out_w, 1),
+                    (os.POSIX_SPAWN_DUP2, err_w, 2),
+                ],
+                # Python ignores these; restore the defaults like Popen(restore_signals=True)
+                # so pipeline producers (yes | head) die quietly on a closed pipe
+                setsigdef=(signal.SIGPIPE, signal.SIGXFSZ),
+                setsid=True
+            )
+        except Exception:
+            os.close(out_r)
+            os.close(err_r)
+            raise
+        finally:
+            os.close(out_w)
+            os.close(err_w)
+
+        self.stdout = os.fdopen(out_r, 'rb', buffering=0)
+        self.stderr = os.fdopen(err_r, 'rb', buffering=0)
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is not None:
+            return self.returncode
+
+        if timeout is not None and self.poll() is None:
+            if hasattr(os, 'pidfd_open'):
+                pidfd = os.pidfd_open(self.pid)
+                try:
+                    ready, _, _ = select.select([pidfd], [], [], timeout)
+                finally:
+                    os.close(pidfd)
+                if not ready:
+                    raise subprocess.TimeoutExpired(self.pid, timeout)
+            else:
+                deadline = time.monotonic() + timeout
+                while self.poll() is None:
+                    if time.monotonic() >= deadline:
+                        raise subprocess.TimeoutExpired(self.pid, timeout)
+                    time.sleep(0.005)
+
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+
+def _run_process(args, shell: bool, timeout: float, cwd: str) -> tuple[int, bytes, bytes]:
+    """
+    Run a process and capture stdout/stderr with a select() loop over the pipes.
+
+    Avoids the reader threads subprocess.run spins up for each call. Shell commands
+    are started with posix_spawn on Linux. The child gets its own session so the
+    whole process group can be killed on timeout.
+    Raises subprocess.TimeoutExpired (carrying any partial output) on timeout.
+    """
+    if shell and _USE_POSIX_SPAWN:
+        proc = _PosixSpawnedShell(args, cwd)
+    else:
+        proc = subprocess.Popen(
+            args,
+            shell=shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=True
+        )
+    try:
+        stdout, stderr = bytearray(), bytearray()
+        buffers = {proc.stdout.fileno(): stdout, proc.stderr.fileno(): stderr}  # type: ignore
+        for fd in buffers:
+            os.set_blocking(fd, False)
+
+        deadline = time.monotonic() + timeout
+        while buffers:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _kill_process_group(proc)
+                raise subprocess.TimeoutExpired(args, timeout, output=bytes(stdout), stderr=bytes(stderr))
+
+            ready, _, _ = select.select(list(buffers), [], [], remaining)
+            for fd in ready:
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if chunk:
+                    buffers[fd] += chunk
+                else:
+                    del buffers[fd]
+
+        try:
+            returncode = proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            _kill_process_group(proc)
+            raise subprocess.TimeoutExpired(args, timeout, output=bytes(stdout), stderr=bytes(stderr))
+    finally:
+        if proc.returncode is None:
+            # interrupted (exception, KeyboardInterrupt) before the child was reaped;
+            # don't leave it running or as a zombie
+            _kill_process_group(proc)
+        proc.stdout.close()  # type: ignore
+        proc.stderr.close()  # type: ignore
+
+    return returncode, bytes(stdout), bytes(stderr)
+
+
+class BashSessionError(Exception):
+    """Raised when a BashSession can't accept a command (e.g. the shell has exited)."""
+
+
+class BashSession:
+    """
+    Long-lived bash process that runs commands written to its stdin.
+
+    Saves starting a fresh shell per command. Each command runs in its own subshell,
+    so functions, variables, options (set -e) and cd can't carry over into the next
+    command. Each command is followed by per-session sentinels on stdout (carrying
+    the exit code) and stderr so the output can be framed.
+    """
+
+    def __init__(self, cwd: Optional[str] = None):
+        self.proc = subprocess.Popen(
+            ['bash', '--noprofile', '--norc', '-s'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=cwd,
+            start_new_session=True
+        )
+        os.set_blocking(self.proc.stdout.fileno(), False)  # type: ignore
+        os.set_blocking(self.proc.stderr.fileno(), False)  # type: ignore
+        token = os.urandom(8).hex()
+        self._stdout_sentinel = re.compile(rb'\x1e' + token.encode() + rb':(\d+)\x1e$')
+        self._stderr_sentinel = b'\x1e' + token.encode() + b'\x1e'
+        self._token = token
+        self._lock = threading.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def run(self, command: str, timeout: float, cwd: str) -> tuple[int, bytes, bytes]:
+        """
+        Run a command in the session, returning (exit code, stdout, stderr).
+
+        Raises BashSessionError if the command couldn't be sent, so the caller can fall
+        back to one-shot execution, and subprocess.TimeoutExpired (closing the session)
+        on timeout.
+        """
+        with self._lock:
+            if not self.alive:
+                raise BashSessionError('bash session has exited')
+
+            # the subshell isolates each command's state from the next; eval keeps syntax
+            # errors in the command from killing the session shell
+            script = (
+                f"( cd {shlex.quote(cwd)} && eval {shlex.quote(command)} ) </dev/null\n"
+                f"__rc=$?; printf '\\036{self._token}:%d\\036' \"$__rc\"; printf '\\036{self._token}\\036' >&2\n"
+            )
+            try:
+                self.proc.stdin.write(script.encode())  # type: ignore
+                self.proc.stdin.flush()  # type: ignore
+            except (BrokenPipeError, OSError) as e:
+                self.close()
+                raise BashSessionError(str(e))
+
+            stdout, stderr = bytearray(), bytearray()
+            buffers = {self.proc.stdout.fileno(): stdout, self.proc.stderr.fileno(): stderr}  # type: ignore
+            deadline = time.monotonic() + timeout
+            while True:
+                match = self._stdout_sentinel.search(stdout)
+                if match and stderr.endswith(self._stderr_sentinel):
+                    exit_code = int(match.group(1))
+                    return exit_code, bytes(stdout[:match.start()]), bytes(stderr[:-len(self._stderr_sentinel)])
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.close()
+                    raise subprocess.TimeoutExpired(command, timeout, output=bytes(stdout), stderr=bytes(stderr))
+
+                ready, _, _ = select.select(list(buffers), [], [], remaining)
+                for fd in ready:
+                    try:
+                        chunk = os.read(fd, 65536)
+                    except BlockingIOError:
+                        continue
+                    if chunk:
+                        buffers[fd] += chunk
+                    else:
+                        # the session shell itself went away (e.g. it was killed), so report its exit status
+                        self.proc.wait()
+                        self.close()
+                        return self.proc.returncode, bytes(stdout), bytes(stderr)
+
+    def close(self) -> None:
+        if self.alive:
+            _kill_process_group(self.proc)
+        for stream in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+            try:
+                stream.close()  # type: ignore
+            except Exception:
+                pass
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+# sessions are owned by whoever requested them (e.g. the Runtime for a thread)
+_sessions: 'weakref.WeakValueDictionary[int, BashSession]' = weakref.WeakValueDictionary()
+_sessions_lock = threading.Lock()
+
+
+def get_bash_session(thread_id: int) -> BashSession:
+    """Get the live BashSession for a thread, starting a new one if needed."""
+    with _sessions_lock:
+        session = _sessions.get(thread_id)
+        if session is None or not session.alive:
+            session = BashSession()
+            _sessions[thread_id] = session
+        return session
+
+
+def _missing_cwd_error(cwd: str) -> str:
+    return f"Execution error: working directory does not exist: {cwd}"
+
+
+_SHELL_METACHARACTERS = re.compile(r'[|&;<>$`(){}\[\]*?!~#\\\n]')
+
+
+def _direct_argv(command: str) -> Optional[List[str]]:
+    """argv for a command that needs no shell features, or None if it must go through the shell."""
+    if _SHELL_METACHARACTERS.search(command):
+        return None
+    try:
+        return shlex.split(command) or None
+    except ValueError:
+        return None
+
+
 def execute_bash_command(
     command: str,
     timeout: Optional[int] = None,
@@ -190,7 +554,8 @@ def execute_bash_command(
     sandbox_mode: Optional[str] = None,
     justification: str = None,
     cwd: str = None,
-    approval_system: Optional[ApprovalSystem] = None
+    approval_system: Optional[ApprovalSystem] = None,
+    session: Optional[BashSession] = None
 ) -> BashResult:
     """
     Execute a bash command with approval and sandboxing.
@@ -203,6 +568,8 @@ def execute_bash_command(
         justification: Reason for executing this command
         cwd: Working directory (defaults to current)
         approval_system: Approval system to use (for testing)
+        session: Long-lived BashSession to run the command in, whether or not it
+            needed approval; a session that has exited falls back to one-shot execution
 
     Returns:
         BashResult with execution details
@@ -211,29 +578,16 @@ def execute_bash_command(
     cwd = cwd or os.getcwd()
 
     # Load configuration defaults
-    try:
-        container = Container(throw=False)
-        # Check if container was properly initialized
-        if hasattr(container, 'configuration'):
-            config = container.get('bash_helper', {})
-        else:
-            config = {}  # No config file available
-
-        timeout = timeout if timeout is not None else config.get('default_timeout', 10000)
-        approval_mode = approval_mode if approval_mode is not None else config.get('default_approval_mode', 'on_request')
-        sandbox_mode = sandbox_mode if sandbox_mode is not None else config.get('default_sandbox_mode', 'workspace_write')
-
-    except (ValueError, FileNotFoundError):
-        # Fallback to defaults if config is not available
-        timeout = timeout if timeout is not None else 10000
-        approval_mode = approval_mode if approval_mode is not None else 'on_request'
-        sandbox_mode = sandbox_mode if sandbox_mode is not None else 'workspace_write'
+    config = _get_bash_config()
+    timeout = timeout if timeout is not None else config.get('default_timeout', 10000)
+    approval_mode = approval_mode if approval_mode is not None else config.get('default_approval_mode', 'on_request')
+    sandbox_mode = sandbox_mode if sandbox_mode is not None else config.get('default_sandbox_mode', 'workspace_write')
 
     # Initialize systems
     if approval_system is None:
         approval_system = ApprovalSystem()
 
-    safety_assessor = CommandSafetyAssessor()
+    safety_assessor = _get_safety_assessor()
 
     # Safety assessment
     needs_approval = False
@@ -260,25 +614,66 @@ def execute_bash_command(
                 was_approved=False
             )
 
+    # Check the working directory up front so every execution path reports it the same way
+    if not os.path.isdir(cwd):
+        return BashResult(
+            stdout="",
+            stderr=_missing_cwd_error(cwd),
+            exit_code=1,
+            command=command,
+            execution_time=time.time() - start_time,
+            was_approved=True
+        )
+
+    # Simple trusted commands are exec'd directly, skipping the /bin/sh fork and parse
+    argv = _direct_argv(command) if safety_assessor.is_known_safe(command) else None
+
     # Execute the command
     try:
-        # For MVP, we'll use basic subprocess execution
-        # Later we can add sandboxing for macOS
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout / 1000.0,  # Convert to seconds
-            cwd=cwd
-        )
+        returncode = None
+        if session is not None:
+            try:
+                returncode, stdout, stderr = session.run(command, timeout / 1000.0, cwd)
+            except BashSessionError as e:
+                logging.debug(f"Bash session unavailable, falling back to one-shot execution: {e}")
+
+        if returncode is None:
+            # For MVP, we'll use basic subprocess execution
+            # Later we can add sandboxing for macOS
+            returncode, stdout, stderr = _run_process(
+                argv if argv else command,
+                shell=not argv,
+                timeout=timeout / 1000.0,  # Convert to seconds
+                cwd=cwd
+            )
 
         execution_time = time.time() - start_time
 
         return BashResult(
-            stdout=result.stdout,
-            stderr=result.stderr,
-            exit_code=result.returncode,
+            stdout=_decode_output(stdout),
+            stderr=_decode_output(stderr),
+            exit_code=returncode,
+            command=command,
+            execution_time=execution_time,
+            was_approved=True
+        )
+
+    except FileNotFoundError as e:
+        execution_time = time.time() - start_time
+        if argv and e.filename == argv[0]:
+            # direct argv execution of a missing binary; mirror the shell's "not found"
+            return BashResult(
+                stdout="",
+                stderr=f"{argv[0]}: command not found",
+                exit_code=127,
+                command=command,
+                execution_time=execution_time,
+                was_approved=True
+            )
+        return BashResult(
+            stdout="",
+            stderr=f"Execution error: {str(e)}",
+            exit_code=1,
             command=command,
             execution_time=execution_time,
             was_approved=True
@@ -307,6 +702,170 @@ def execute_bash_command(
         )
 
 
+def _split_batch_output(output: str, marker: re.Pattern, count: int) -> tuple[list[str], dict[int, int]]:
+    """Split framed batch output into per-command chunks, returning (chunks, exit codes by index)."""
+    chunks = [''] * count
+    exit_codes: dict[int, int] = {}
+    position = 0
+    for match in marker.finditer(output):
+        index = int(match.group(1))
+        if index < count:
+            chunks[index] = output[position:match.start()]
+            if match.lastindex and match.lastindex > 1:
+                exit_codes[index] = int(match.group(2))
+        position = match.end()
+    # anything after the last marker belongs to the command that didn't finish
+    trailing = output[position:]
+    if trailing:
+        unfinished = next((i for i in range(count) if i not in exit_codes), None)
+        if unfinished is not None:
+            chunks[unfinished] += trailing
+    return chunks, exit_codes
+
+
+def _run_trusted_batch(commands: List[str], timeout: int, cwd: str) -> List[BashResult]:
+    """Run already-trusted commands in a single shell invocation and split the results back out."""
+    start_time = time.time()
+
+    if not os.path.isdir(cwd):
+        return [
+            BashResult(
+                stdout="",
+                stderr=_missing_cwd_error(cwd),
+                exit_code=1,
+                command=command,
+                execution_time=time.time() - start_time,
+                was_approved=True
+            )
+            for command in commands
+        ]
+
+    # each command runs in its own subshell so `exit` or `cd` can't leak into the next one,
+    # then frames its output: '\x1e<token>:<index>:<exit code>\x1e' on stdout and
+    # '\x1e<token>:<index>\x1e' on stderr. The random per-call token keeps a command's
+    # own output from forging another command's frame.
+    token = os.urandom(8).hex()
+    stdout_marker = re.compile(r'\x1e' + token + r':(\d+):(\d+)\x1e')
+    stderr_marker = re.compile(r'\x1e' + token + r':(\d+)\x1e')
+    script = '\n'.join(
+        f"( eval {shlex.quote(command)} ); __rc=$?; "
+        f"printf '\\036{token}:{i}:%d\\036' \"$__rc\"; printf '\\036{token}:{i}\\036' >&2"
+        for i, command in enumerate(commands)
+    )
+
+    timed_out = False
+    try:
+        _, stdout, stderr = _run_process(
+            script,
+            shell=True,
+            timeout=timeout / 1000.0,  # Convert to seconds
+            cwd=cwd
+        )
+    except subprocess.TimeoutExpired as e:
+        timed_out = True
+        stdout, stderr = e.stdout or b'', e.stderr or b''
+    except Exception as e:
+        execution_time = time.time() - start_time
+        return [
+            BashResult(
+                stdout="",
+                stderr=f"Execution error: {str(e)}",
+                exit_code=1,
+                command=command,
+                execution_time=execution_time,
+                was_approved=True
+            )
+            for command in commands
+        ]
+
+    execution_time = time.time() - start_time
+    stdout_chunks, exit_codes = _split_batch_output(_decode_output(stdout), stdout_marker, len(commands))
+    stderr_chunks, _ = _split_batch_output(_decode_output(stderr), stderr_marker, len(commands))
+
+    results = []
+    for i, command in enumerate(commands):
+        if i in exit_codes:
+            results.append(BashResult(
+                stdout=stdout_chunks[i],
+                stderr=stderr_chunks[i],
+                exit_code=exit_codes[i],
+                command=command,
+                execution_time=execution_time,
+                was_approved=True
+            ))
+        else:
+            results.append(BashResult(
+                stdout=stdout_chunks[i],
+                stderr=f"Command timed out after {timeout}ms" if timed_out else stderr_chunks[i],
+                exit_code=124 if timed_out else 1,
+                command=command,
+                execution_time=execution_time,
+                was_approved=True
+            ))
+    return results
+
+
+def execute_bash_batch(
+    commands: List[str],
+    timeout: Optional[int] = None,
+    approval_mode: Optional[str] = None,
+    sandbox_mode: Optional[str] = None,
+    justification: str = None,
+    cwd: str = None,
+    approval_system: Optional[ApprovalSystem] = None
+) -> List[BashResult]:
+    """
+    Execute a sequence of bash commands, sharing one shell invocation between trusted commands.
+
+    Consecutive known-safe commands are run together in a single shell, saving a
+    fork/exec per command. Every other command goes through execute_bash_command
+    on its own so it gets the usual approval flow. Commands still run in order.
+
+    Args:
+        commands: The bash commands to execute, in order
+        timeout: Timeout in milliseconds per command (uses config default if None)
+        approval_mode: "never", "on_request", "on_failure", "unless_trusted" (uses config default if None)
+        sandbox_mode: "read_only", "workspace_write", "danger_full_access" (uses config default if None)
+        justification: Reason for executing these commands
+        cwd: Working directory (defaults to current)
+        approval_system: Approval system to use (for testing)
+
+    Returns:
+        One BashResult per command, in the same order. Batched commands report the
+        wall time of the shared invocation as their execution_time.
+    """
+    cwd = cwd or os.getcwd()
+    timeout = timeout if timeout is not None else _get_bash_config().get('default_timeout', 10000)
+    safety_assessor = _get_safety_assessor()
+
+    results: List[BashResult] = []
+    pending: List[str] = []
+
+    def flush_pending():
+        if pending:
+            results.extend(_run_trusted_batch(pending, timeout * len(pending), cwd))
+            pending.clear()
+
+    for command in commands:
+        if safety_assessor.is_known_safe(command):
+            pending.append(command)
+            continue
+
+        flush_pending()
+        results.append(execute_bash_command(
+            command=command,
+            timeout=timeout,
+            approval_mode=approval_mode,
+            sandbox_mode=sandbox_mode,
+            justification=justification,
+            cwd=cwd,
+            approval_system=approval_system
+        ))
+
+    flush_pending()
+    return results
+
+
 def execute_bash_command_for_testing(
     command: str,
     timeout: Optional[int] = None,
@@ -609,7 +609,8 @@ class BCL():
              timeout: Optional[int] = None,
              approval_mode: Optional[str] = None,
              sandbox_mode: Optional[str] = None,
-             justification: str = None):
+             justification: str = None,
+             session=None):
         """
         Execute a bash command with approval and sandboxing.
 
@@ -623,6 +624,7 @@ class BCL():
             approval_mode: "never", "on_request", "on_failure", "unless_trusted" (uses config default if None)
             sandbox_mode: "read_only", "workspace_write", "danger_full_access" (uses config default if None)
             justification: Reason for executing this command (helps with approval decisions)
+            session: Internal - long-lived BashSession supplied by the runtime, leave as None
 
         Returns:
             The return value should NEVER be accessed directly. Always pass it to result() immediately.
@@ -649,8 +651,7 @@ class BCL():
                            approval_mode="unless_trusted",
                            justification="Cleaning up temporary files"))
         """
-        from llmvm.server.bash_helper import CommandSafetyAssessor, ApprovalSystem
-        from llmvm.common.container import Container
+        from llmvm.server.bash_helper import ApprovalSystem, _get_bash_config, _get_safety_assessor
         import sys
 
         logging.debug(f"BCL.bash('{command}', timeout={timeout}, approval_mode={approval_mode})")
@@ -658,22 +659,13 @@ class BCL():
         cwd = os.getcwd()
 
         # Load configuration defaults
-        try:
-            container = Container(throw=False)
-            if hasattr(container, 'configuration'):
-                config = container.get('bash_helper', {})
-            else:
-                config = {}
-            timeout = timeout if timeout is not None else config.get('default_timeout', 10000)
-            approval_mode = approval_mode if approval_mode is not None else config.get('default_approval_mode', 'on_request')
-            sandbox_mode = sandbox_mode if sandbox_mode is not None else config.get('default_sandbox_mode', 'workspace_write')
-        except (ValueError, FileNotFoundError):
-            timeout = timeout if timeout is not None else 10000
-            approval_mode = approval_mode if approval_mode is not None else 'on_request'
-            sandbox_mode = sandbox_mode if sandbox_mode is not None else 'workspace_write'
+        config = _get_bash_config()
+        timeout = timeout if timeout is not None else config.get('default_timeout', 10000)
+        approval_mode = approval_mode if approval_mode is not None else config.get('default_approval_mode', 'on_request')
+        sandbox_mode = sandbox_mode if sandbox_mode is not None else config.get('default_sandbox_mode', 'workspace_write')
 
         # Check if approval is needed
-        safety_assessor = CommandSafetyAssessor()
+        safety_assessor = _get_safety_assessor()
         approval_system = ApprovalSystem()
 
         needs_approval = False
@@ -722,7 +714,8 @@ class BCL():
             approval_mode=approval_mode,
             sandbox_mode=sandbox_mode,
             justification=justification,
-            cwd=cwd
+            cwd=cwd,
+            session=session
         )
 
         # LOG: Debug normal execution result
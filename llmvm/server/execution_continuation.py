@@ -5,18 +5,33 @@ When a bash command needs approval, we pause the execution and store the context
 After approval, we resume execution with the BashResult replacing the ApprovalRequest.
 """
 
-import uuid
-import asyncio
+import itertools
+import secrets
 import logging
-from typing import Dict, Optional, Any, Callable, Awaitable
-from dataclasses import dataclass
-
-from llmvm.common.objects import ApprovalRequest, AstNode
+import time
+from collections import OrderedDict
+from logging import DEBUG
+from typing import Optional, Any, Callable, Awaitable
+from dataclasses import dataclass, field
+
+from llmvm.common.helpers import Helpers
+from llmvm.common.objects import ApprovalRequest, AstNode, Content, MessageModel, TextContent, User
 from llmvm.server.bash_helper import BashResult
 
 logging = logging.getLogger(__name__)
 
-@dataclass
+# execution ids only need to be unique within this server process; the nonce keeps
+# ids from a previous process from resolving after a restart
+_PROC_NONCE = secrets.token_hex(4)
+_execution_counter = itertools.count()
+
+_RESULTS_PREAMBLE = "The bash command you requested has been completed. Here are the results:"
+_RESULTS_INSTRUCTION = (
+    "Please process these results and provide a complete response to the user's original request. "
+    "Do not run the command again."
+)
+
+@dataclass(slots=True)
 class ExecutionContext:
     """Complete stored execution context for continuation after approval"""
     # Core execution data
@@ -43,15 +58,25 @@ class ExecutionContext:
     original_controller: Any  # Reference to the original ExecutionController
     continuation_callback: Optional[Callable] = None
 
+    # Positions in code_execution_result holding this execution's ApprovalRequest
+    approval_indices: list[int] = field(default_factory=list)
+
+    created_at: float = field(default_factory=time.monotonic)
+
 class ExecutionContinuationRegistry:
     """Registry for paused executions waiting for bash approval"""
 
     _instance: Optional['ExecutionContinuationRegistry'] = None
 
+    # paused contexts hold whole message histories and runtime state, so keep the
+    # registry bounded when clients never come back with an approval
+    MAX_PENDING = 128
+    PENDING_TTL_SECONDS = 60 * 60
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._pending: Dict[str, ExecutionContext] = {}
+            cls._instance._pending: OrderedDict[str, ExecutionContext] = OrderedDict()
         return cls._instance
 
     def pause_execution(self,
@@ -76,10 +101,14 @@ class ExecutionContinuationRegistry:
         """
         Pause execution and store context for later resumption.
 
+        Ownership of code_execution_result, messages, cookies, helpers and
+        template_args passes to the registry; they are stored without copying,
+        so the caller must not mutate them after pausing.
+
         Returns:
             execution_id: Unique ID to resume execution later
         """
-        execution_id = str(uuid.uuid4())
+        execution_id = f"{_PROC_NONCE}-{next(_execution_counter):x}"
 
         # Add execution_id to approval request for client to send back
         approval_request.execution_id = execution_id
@@ -87,28 +116,36 @@ class ExecutionContinuationRegistry:
         context = ExecutionContext(
             approval_request=approval_request,
             execution_id=execution_id,
-            code_execution_result=code_execution_result.copy(),
+            code_execution_result=code_execution_result,
             runtime_state=runtime_state,
-            messages=messages.copy(),
+            messages=messages,
             # Original request context
             thread_id=thread_id,
             temperature=temperature,
             model=model,
             max_output_tokens=max_output_tokens,
             compression=compression,
-            cookies=cookies.copy(),
-            helpers=helpers.copy(),
-            template_args=template_args.copy(),
+            cookies=cookies,
+            helpers=helpers,
+            template_args=template_args,
             thinking=thinking,
             # Response handling
             stream_handler=stream_handler,
             original_queue=original_queue,
-            original_controller=original_controller
+            original_controller=original_controller,
+            approval_indices=[
+                i for i, item in enumerate(code_execution_result)
+                if isinstance(item, ApprovalRequest) and item.execution_id == execution_id
+            ]
         )
 
+        self._evict_expired()
         self._pending[execution_id] = context
+        while len(self._pending) > self.MAX_PENDING:
+            evicted_id, _ = self._pending.popitem(last=False)
+            logging.warning("🔍 CONTINUATION: Too many pending executions, evicting oldest %s", evicted_id)
 
-        logging.info(f"🔍 CONTINUATION: Paused execution {execution_id} for approval")
+        logging.info("🔍 CONTINUATION: Paused execution %s for approval", execution_id)
         return execution_id
 
 
@@ -127,45 +164,34 @@ class ExecutionContinuationRegistry:
         context = self._pending[execution_id]
 
         # Replace ApprovalRequest with BashResult in the execution results
-        updated_results = []
-        replaced_count = 0
-        logging.info(f"🔍 CONTINUATION: Processing {len(context.code_execution_result)} execution results")
-
-        for i, item in enumerate(context.code_execution_result):
-            logging.info(f"🔍   Result {i}: {type(item).__name__}")
-
-            if isinstance(item, ApprovalRequest) and item.execution_id == execution_id:
-                # Replace ApprovalRequest with BashResult
-                updated_results.append(bash_result)
-                replaced_count += 1
-                logging.info(f"🔍   REPLACED ApprovalRequest with BashResult at position {i}")
-                logging.info(f"🔍   BashResult: stdout='{bash_result.stdout[:100]}...', exit_code={bash_result.exit_code}")
-            else:
-                updated_results.append(item)
-
-        logging.info(f"🔍 CONTINUATION: Replaced {replaced_count} ApprovalRequest(s) with BashResult")
+        updated_results = list(context.code_execution_result)
+        for i in context.approval_indices:
+            updated_results[i] = bash_result
+            if logging.isEnabledFor(DEBUG):
+                logging.debug(f"🔍   REPLACED ApprovalRequest with BashResult at position {i}")
+                logging.debug(f"🔍   BashResult: stdout='{bash_result.stdout[:100]}...', exit_code={bash_result.exit_code}")
+        replaced_count = len(context.approval_indices)
+
+        logging.info(
+            "🔍 CONTINUATION: Replaced %d ApprovalRequest(s) with BashResult in %d execution results",
+            replaced_count, len(updated_results)
+        )
 
         # Build the continuation message with results
-        from llmvm.common.helpers import Helpers
-        from llmvm.common.objects import TextContent, User
-
-        # Build content messages with clear context about what happened
-        content_messages = [
-            TextContent("The bash command you requested has been completed. Here are the results:"),
-            TextContent("<helpers_result>")
+        result_contents = [
+            c if isinstance(c, Content)
+            else TextContent(c if isinstance(c, str) else Helpers.str_get_str(c))
+            for c in updated_results
         ]
 
-        for c in updated_results:
-            from llmvm.common.objects import Content
-            if isinstance(c, Content):
-                content_messages.append(c)
-            else:
-                content_messages.append(TextContent(Helpers.str_get_str(c)))
-
-        content_messages.extend([
+        # Build content messages with clear context about what happened, in one allocation
+        content_messages = [
+            TextContent(_RESULTS_PREAMBLE),
+            TextContent("<helpers_result>"),
+            *result_contents,
             TextContent("</helpers_result>"),
-            TextContent("Please process these results and provide a complete response to the user's original request. Do not run the command again.")
-        ])
+            TextContent(_RESULTS_INSTRUCTION),
+        ]
 
         # Create User message with the results
         completed_code_user_message = User(content_messages, hidden=False)
@@ -174,19 +200,22 @@ class ExecutionContinuationRegistry:
         continuation_messages = context.messages.copy()
         continuation_messages.append(completed_code_user_message)
 
-        logging.info(f"🔍 CONTINUATION: Built continuation with {len(continuation_messages)} messages")
+        logging.info("🔍 CONTINUATION: Built continuation with %d messages", len(continuation_messages))
 
         # Clean up pending execution
         del self._pending[execution_id]
 
         # Continue execution using the provided controller and stream_handler
         try:
-            logging.info(f"🔍 CONTINUATION: Continuing execution with provided controller")
+            logging.info("🔍 CONTINUATION: Continuing execution with provided controller")
 
             # Convert messages to the format expected by aexecute_continuation
-            from llmvm.common.objects import MessageModel
-            converted_messages = [MessageModel.to_message(msg) if hasattr(msg, 'content') else msg
-                                for msg in continuation_messages]
+            # (only MessageModel has a .content attribute; Message objects pass through untouched)
+            if any(isinstance(msg, MessageModel) for msg in continuation_messages):
+                converted_messages = [msg.to_message() if isinstance(msg, MessageModel) else msg
+                                      for msg in continuation_messages]
+            else:
+                converted_messages = continuation_messages
 
             result_messages, updated_runtime_state = await controller.aexecute_continuation(
                 messages=converted_messages,
@@ -202,16 +231,23 @@ class ExecutionContinuationRegistry:
                 thinking=context.thinking
             )
 
-            logging.info(f"🔍 CONTINUATION: Execution completed successfully with {len(result_messages)} result messages")
+            logging.info("🔍 CONTINUATION: Execution completed successfully with %d result messages", len(result_messages))
             return (True, result_messages)
 
-        except Exception as e:
-            logging.error(f"🔍 CONTINUATION: Failed to continue execution: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logging.exception("🔍 CONTINUATION: Failed to continue execution")
             return (False, [])
 
 
+    def _evict_expired(self) -> None:
+        cutoff = time.monotonic() - self.PENDING_TTL_SECONDS
+        while self._pending:
+            execution_id, context = next(iter(self._pending.items()))
+            if context.created_at > cutoff:
+                break
+            del self._pending[execution_id]
+            logging.warning("🔍 CONTINUATION: Pending execution %s expired without approval", execution_id)
+
     def get_pending_count(self) -> int:
         """Get number of pending executions"""
         return len(self._pending)
\ No newline at end of file
@@ -59,7 +59,7 @@ from llmvm.common.objects import (
 )
 from llmvm.server.auto_global_dict import AutoGlobalDict
 from llmvm.server.python_execution_controller import ExecutionController
-from llmvm.server.bash_helper import BashResult
+from llmvm.server.bash_helper import BashResult, BashSession, get_bash_session
 
 logging = setup_logging()
 
@@ -192,6 +192,7 @@ class Runtime:
         self.original_query = ""
         self.original_code = ""
         self.thinking = thinking
+        self._bash_session: Optional[BashSession] = None
 
     def setup(self) -> "Runtime":
         """
@@ -1261,6 +1262,11 @@ class Runtime:
         """
         logging.debug(f"Runtime.bash('{command}', timeout={timeout}, approval_mode={approval_mode})")
 
+        # Keep one long-lived bash process per thread; holding it here keeps it alive
+        # for as long as this runtime
+        if self._bash_session is None or not self._bash_session.alive:
+            self._bash_session = get_bash_session(self.thread_id)
+
         # Delegate to BCL.bash
         from llmvm.server.bcl import BCL
         return BCL.bash(
@@ -1268,7 +1274,8 @@ class Runtime:
             timeout=timeout,
             approval_mode=approval_mode,
             sandbox_mode=sandbox_mode,
-            justification=justification
+            justification=justification,
+            session=self._bash_session
         )
 
 
@@ -1,12 +1,36 @@
-import json
+import asyncio
+import contextlib
+import functools
 import os
+import re
 import sqlite3
-import tempfile
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
-import pandas as pd
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI, OpenAI
+
+_SAMPLE_ROW_COUNT = 5
+
+_BUSINESS_DOMAINS = {
+    'ecommerce': ['order', 'customer', 'product', 'cart', 'payment', 'shipping'],
+    'healthcare': ['patient', 'doctor', 'appointment', 'medical', 'treatment'],
+    'education': ['student', 'course', 'grade', 'enrollment', 'teacher'],
+    'finance': ['account', 'transaction', 'balance', 'loan', 'investment'],
+    'hr': ['employee', 'department', 'salary', 'performance', 'attendance']
+}
+
+_KEYWORD_DOMAINS = {keyword: domain for domain, keywords in _BUSINESS_DOMAINS.items() for keyword in keywords}
+
+# One pass over the text finds every domain keyword; the lookahead also catches
+# keywords that overlap each other, matching the substring semantics of `in`
+_DOMAIN_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, _KEYWORD_DOMAINS)) + "))",
+    re.IGNORECASE
+)
 
 class SemanticDatabaseHelpers:
     """
@@ -21,6 +45,13 @@ class SemanticDatabaseHelpers:
     _business_context_cache = {}
     _vector_store_cache = {}
     _cache_dir = Path.home() / ".local/share/llmvm/semantic_database_cache"
+    _cache_loaded = False
+    _LEGACY_CACHE_NAMES = ('schemas', 'business_context', 'vector_stores')  # per-cache files from earlier versions
+    _cache_mtime_ns: Optional[int] = None  # cache.json mtime as of the last load or save
+
+    # Shared OpenAI client so every call reuses the same keep-alive connection pool
+    _openai_client: Optional[OpenAI] = None
+    _openai_client_lock = threading.Lock()
 
     @classmethod
     def _ensure_cache_dir(cls):
@@ -37,51 +68,77 @@ class SemanticDatabaseHelpers:
         """Save in-memory cache to disk for persistence"""
         cls._ensure_cache_dir()
 
-        # Save schema cache
-        schema_file = cls._cache_dir / "schemas.json"
-        with open(schema_file, 'w') as f:
-            json.dump(cls._schema_cache, f, indent=2)
+        # All caches live in a single file so a save is one write rather than three
+        cache = {
+            'schemas': cls._schema_cache,
+            'business_context': cls._business_context_cache,
+            'vector_stores': cls._vector_store_cache
+        }
+        cache_file = cls._cache_dir / "cache.json"
+
+        # Write to a sibling file and swap it in so a crash mid-write can't leave a torn cache
+        temp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            temp_file.write_bytes(orjson.dumps(cache, option=orjson.OPT_INDENT_2))
+            os.replace(temp_file, cache_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
 
-        # Save business context cache
-        context_file = cls._cache_dir / "business_context.json"
-        with open(context_file, 'w') as f:
-            json.dump(cls._business_context_cache, f, indent=2)
+        # cache.json now holds everything; drop the pre-migration files so their
+        # (possibly deleted) vector store ids can't come back if cache.json goes away
+        for name in cls._LEGACY_CACHE_NAMES:
+            (cls._cache_dir / f"{name}.json").unlink(missing_ok=True)
 
-        # Save vector store cache
-        vector_store_file = cls._cache_dir / "vector_stores.json"
-        with open(vector_store_file, 'w') as f:
-            json.dump(cls._vector_store_cache, f, indent=2)
+        cls._cache_loaded = True
+        cls._cache_mtime_ns = cache_file.stat().st_mtime_ns
 
     @classmethod
     def _load_cache_from_disk(cls):
-        """Load cache from disk into memory"""
-        cls._ensure_cache_dir()
-
-        # Load schema cache
-        schema_file = cls._cache_dir / "schemas.json"
-        if schema_file.exists():
-            with open(schema_file, 'r') as f:
-                cls._schema_cache = json.load(f)
+        """Load cache from disk into memory, skipping the read if the file is unchanged since the last load"""
+        cache_file = cls._cache_dir / "cache.json"
+        try:
+            mtime_ns = cache_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
 
-        # Load business context cache
-        context_file = cls._cache_dir / "business_context.json"
-        if context_file.exists():
-            with open(context_file, 'r') as f:
-                cls._business_context_cache = json.load(f)
+        if cls._cache_loaded and mtime_ns == cls._cache_mtime_ns:
+            return
 
-        # Load vector store cache
-        vector_store_file = cls._cache_dir / "vector_stores.json"
-        if vector_store_file.exists():
-            with open(vector_store_file, 'r') as f:
-                cls._vector_store_cache = json.load(f)
+        if mtime_ns is not None:
+            cache = orjson.loads(cache_file.read_bytes())
+        else:
+            # Fall back to the separate cache files written by earlier versions
+            cache = {}
+            for name in cls._LEGACY_CACHE_NAMES:
+                legacy_file = cls._cache_dir / f"{name}.json"
+                if legacy_file.exists():
+                    cache[name] = orjson.loads(legacy_file.read_bytes())
+
+        cls._schema_cache = cache.get('schemas', cls._schema_cache)
+        cls._business_context_cache = cache.get('business_context', cls._business_context_cache)
+        cls._vector_store_cache = cache.get('vector_stores', cls._vector_store_cache)
+        cls._cache_loaded = True
+        cls._cache_mtime_ns = mtime_ns
 
     @classmethod
-    def _get_openai_client(cls) -> OpenAI:
-        """Get OpenAI client instance"""
+    def _get_openai_api_key(cls) -> str:
+        """Get the OpenAI API key from the environment"""
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is required")
-        return OpenAI(api_key=api_key)
+        return api_key
+
+    @classmethod
+    def _get_openai_client(cls) -> OpenAI:
+        """Get the shared OpenAI client instance, creating it on first use"""
+        if cls._openai_client is not None:
+            return cls._openai_client
+
+        with cls._openai_client_lock:
+            if cls._openai_client is None:
+                cls._openai_client = OpenAI(api_key=cls._get_openai_api_key())
+            return cls._openai_client
 
     @staticmethod
     def create_semantic_understanding(db_path: str, force_refresh: bool = False) -> str:
@@ -112,14 +169,186 @@ class SemanticDatabaseHelpers:
 
         try:
             client = SemanticDatabaseHelpers._get_openai_client()
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
 
             # Get database name for vector store
             db_name = Path(db_path).stem
+            tables, full_semantic_doc = SemanticDatabaseHelpers._build_semantic_doc(db_path)
+
+            # Create vector store and upload semantic understanding
+            vector_store = client.vector_stores.create(
+                name=f"Semantic DB: {db_name}",
+                expires_after={"anchor": "last_active_at", "days": 30}  # Auto-cleanup after 30 days
+            )
+
+            file_upload = None
+            try:
+                # Upload the semantic documentation straight from memory
+                file_upload = client.files.create(
+                    file=(f"{db_name}.md", full_semantic_doc.encode('utf-8'), 'text/markdown'),
+                    purpose='assistants'
+                )
+
+                # Add file to vector store
+                client.vector_stores.files.create(
+                    vector_store_id=vector_store.id,
+                    file_id=file_upload.id
+                )
+
+            except Exception:
+                # Don't leave an orphaned vector store or file billing against the account
+                SemanticDatabaseHelpers._delete_openai_resources(
+                    client, vector_store.id, file_upload.id if file_upload else None
+                )
+                raise
+
+            SemanticDatabaseHelpers._cache_semantic_understanding(
+                cache_key, db_name, tables, full_semantic_doc, vector_store.id, file_upload.id
+            )
+            SemanticDatabaseHelpers._save_cache_to_disk()
+
+            return SemanticDatabaseHelpers._created_message(db_path, tables, full_semantic_doc, vector_store.id, file_upload.id)
+
+        except Exception as e:
+            return f"Error creating semantic understanding for {db_path}: {str(e)}"
+
+    @staticmethod
+    def create_semantic_understanding_many(db_paths: List[str], force_refresh: bool = False) -> Dict[str, str]:
+        """
+        Create semantic understanding for several databases at once, uploading them concurrently.
+
+        Example:
+        results = SemanticDatabaseHelpers.create_semantic_understanding_many(['./ecommerce.db', './hr.db'])
+
+        :param db_paths: Paths to the database files
+        :param force_refresh: Force recreation of vector stores even if cached
+        :return: Dictionary of database path to status message
+        """
+        return asyncio.run(SemanticDatabaseHelpers.acreate_semantic_understanding_many(db_paths, force_refresh))
+
+    @staticmethod
+    async def acreate_semantic_understanding_many(
+        db_paths: List[str],
+        force_refresh: bool = False,
+        max_concurrency: int = 5,
+    ) -> Dict[str, str]:
+        """
+        Async version of create_semantic_understanding_many. At most max_concurrency
+        databases are analyzed and uploaded at the same time.
+
+        :param db_paths: Paths to the database files
+        :param force_refresh: Force recreation of vector stores even if cached
+        :param max_concurrency: Maximum number of databases processed concurrently
+        :return: Dictionary of database path to status message
+        """
+        SemanticDatabaseHelpers._load_cache_from_disk()
+        db_paths = list(dict.fromkeys(db_paths))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        try:
+            api_key = SemanticDatabaseHelpers._get_openai_api_key()
+        except ValueError as e:
+            return {db_path: f"Error creating semantic understanding for {db_path}: {str(e)}" for db_path in db_paths}
+
+        async with AsyncOpenAI(api_key=api_key) as client:
+            async def create_one(db_path: str) -> str:
+                cache_key = SemanticDatabaseHelpers._get_cache_key(db_path)
+                if not force_refresh and cache_key in SemanticDatabaseHelpers._vector_store_cache:
+                    vector_store_id = SemanticDatabaseHelpers._vector_store_cache[cache_key]['vector_store_id']
+                    return f"Database semantic understanding already exists for {db_path}. Vector store ID: {vector_store_id}"
+
+                async with semaphore:
+                    try:
+                        db_name = Path(db_path).stem
+                        tables, full_semantic_doc = await asyncio.to_thread(SemanticDatabaseHelpers._build_semantic_doc, db_path)
+
+                        vector_store = await client.vector_stores.create(
+                            name=f"Semantic DB: {db_name}",
+                            expires_after={"anchor": "last_active_at", "days": 30}  # Auto-cleanup after 30 days
+                        )
+
+                        file_upload = None
+                        try:
+                            file_upload = await client.files.create(
+                                file=(f"{db_name}.md", full_semantic_doc.encode('utf-8'), 'text/markdown'),
+                                purpose='assistants'
+                            )
+                            await client.vector_stores.files.create(
+                                vector_store_id=vector_store.id,
+                                file_id=file_upload.id
+                            )
+                        except Exception:
+                            await SemanticDatabaseHelpers._adelete_openai_resources(
+                                client, vector_store.id, file_upload.id if file_upload else None
+                            )
+                            raise
+
+                        SemanticDatabaseHelpers._cache_semantic_understanding(
+                            cache_key, db_name, tables, full_semantic_doc, vector_store.id, file_upload.id
+                        )
+                        return SemanticDatabaseHelpers._created_message(
+                            db_path, tables, full_semantic_doc, vector_store.id, file_upload.id
+                        )
+
+                    except Exception as e:
+                        return f"Error creating semantic understanding for {db_path}: {str(e)}"
+
+            results = await asyncio.gather(*(create_one(db_path) for db_path in db_paths))
+
+        # One cache write for the whole batch
+        SemanticDatabaseHelpers._save_cache_to_disk()
+        return dict(zip(db_paths, results))
+
+    @staticmethod
+    def _cache_semantic_understanding(
+        cache_key: str,
+        db_name: str,
+        tables: List[str],
+        full_semantic_doc: str,
+        vector_store_id: str,
+        file_id: str,
+    ) -> None:
+        """Record a newly created vector store in the in-memory caches"""
+        # Cache the vector store information
+        SemanticDatabaseHelpers._vector_store_cache[cache_key] = {
+            'vector_store_id': vector_store_id,
+            'created_at': datetime.now().isoformat(),
+            'file_id': file_id,
+            'db_name': db_name,
+            'tables': tables,
+            'semantic_doc_length': len(full_semantic_doc)
+        }
+
+        # Also update traditional cache
+        SemanticDatabaseHelpers._schema_cache[cache_key] = {
+            'discovered_at': datetime.now().isoformat(),
+            'tables': {table: {'row_count': 0} for table in tables},  # Simplified for this version
+            'vector_store_id': vector_store_id
+        }
+
+    @staticmethod
+    def _created_message(db_path: str, tables: List[str], full_semantic_doc: str, vector_store_id: str, file_id: str) -> str:
+        return f"""Semantic understanding created successfully for {db_path}
+
+Vector Store ID: {vector_store_id}
+Tables analyzed: {len(tables)}
+Semantic document size: {len(full_semantic_doc)} characters
+File ID: {file_id}
+
+The database semantic knowledge is now available for intelligent querying and analysis."""
+
+    @staticmethod
+    def _build_semantic_doc(db_path: str) -> Tuple[List[str], str]:
+        """Introspect the database and build its semantic markdown document"""
+        db_name = Path(db_path).stem
+
+        with contextlib.closing(sqlite3.connect(db_path)) as conn:
+            SemanticDatabaseHelpers._configure_connection(conn)
+            SemanticDatabaseHelpers._optimize_connection(conn)
+            cursor = conn.cursor()
 
             # Analyze database structure
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            # sqlite_% tables (sqlite_sequence, sqlite_stat1, ...) are SQLite internals, not user data
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\';")
             tables = [row[0] for row in cursor.fetchall()]
 
             # Create comprehensive semantic documentation
@@ -136,123 +365,126 @@ This database contains {total_tables} tables and appears to be a {'business/ecom
 """
             semantic_docs.append(overview)
 
-            # Analyze each table in detail
-            for table in tables:
-                # Get column information
-                cursor.execute(f"PRAGMA table_info({table})")
-                columns = cursor.fetchall()
+            # Business domain keywords are collected as each piece of the document is built
+            matched_keywords = SemanticDatabaseHelpers._match_domain_keywords(overview)
+
+            # Get column, foreign key and row count information for every table up front
+            table_columns, table_foreign_keys = SemanticDatabaseHelpers._get_table_metadata(cursor)
+            row_counts = SemanticDatabaseHelpers._get_row_counts(cursor, tables)
+
+            # Analyze each table in detail, reading sample rows over per-worker read-only connections
+            worker = threading.local()
+            worker_conns = []
+
+            def describe_table(table: str) -> Tuple[str, Set[str]]:
+                if not hasattr(worker, 'conn'):
+                    worker.conn = SemanticDatabaseHelpers._connect_read_only(db_path)
+                    worker_conns.append(worker.conn)
+                table_doc = SemanticDatabaseHelpers._describe_table(
+                    worker.conn.cursor(),
+                    table,
+                    table_columns.get(table, []),
+                    table_foreign_keys.get(table, []),
+                    row_counts[table]
+                )
+                return table_doc, SemanticDatabaseHelpers._match_domain_keywords(table_doc)
 
-                # Get foreign key information
-                cursor.execute(f"PRAGMA foreign_key_list({table})")
-                foreign_keys = cursor.fetchall()
+            try:
+                if tables:
+                    with ThreadPoolExecutor(max_workers=min(8, len(tables))) as executor:
+                        for table_doc, table_keywords in executor.map(describe_table, tables):
+                            semantic_docs.append(table_doc)
+                            matched_keywords |= table_keywords
+            finally:
+                for worker_conn in worker_conns:
+                    worker_conn.close()
 
-                # Get sample data (first 5 rows)
-                cursor.execute(f"SELECT * FROM {table} LIMIT 5")
-                sample_rows = cursor.fetchall()
+            SemanticDatabaseHelpers._optimize_connection(conn)
 
-                # Get row count
-                cursor.execute(f"SELECT COUNT(*) FROM {table}")
-                row_count = cursor.fetchone()[0]
+        # Detect business domain and add domain-specific insights
+        domain_analysis = SemanticDatabaseHelpers._analyze_business_domain(matched_keywords)
+        semantic_docs.append(f"\n## Business Domain Analysis\n{domain_analysis}")
 
-                # Create semantic description for this table
-                table_doc = f"""
+        # Create a comprehensive semantic document
+        return tables, "\n".join(semantic_docs)
+
+    @staticmethod
+    def _connect_read_only(db_path: str) -> sqlite3.Connection:
+        """Open a read-only connection to the database that can be used from a worker thread"""
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False)
+        SemanticDatabaseHelpers._configure_connection(conn)
+        return conn
+
+    @staticmethod
+    def _describe_table(cursor: sqlite3.Cursor, table: str, columns: List, foreign_keys: List, row_count: str) -> str:
+        """Build the semantic markdown section for a single table"""
+        # Get sample data (first few rows), fetched as a single batch
+        cursor.arraysize = _SAMPLE_ROW_COUNT
+        cursor.execute(f"SELECT * FROM {SemanticDatabaseHelpers._quote_identifier(table)} LIMIT {_SAMPLE_ROW_COUNT}")
+        sample_rows = cursor.fetchmany()
+
+        # Lowercase names once up front; interning lets the purpose caches hit on identity
+        table_lower = sys.intern(table.lower())
+        col_names_lower = tuple(sys.intern(col[1].lower()) for col in columns)
+
+        # Create semantic description for this table
+        table_doc = [f"""
 ### Table: {table}
-**Purpose**: {SemanticDatabaseHelpers._infer_table_purpose(table, columns)}
+**Purpose**: {SemanticDatabaseHelpers._infer_table_purpose(table, table_lower, col_names_lower)}
 **Row Count**: {row_count}
 
 #### Columns:
-"""
-                for col in columns:
-                    col_name, col_type, not_null, default, pk = col[1], col[2], col[3], col[4], col[5]
-                    purpose = SemanticDatabaseHelpers._infer_column_purpose(col_name, col_type)
-                    table_doc += f"- **{col_name}** ({col_type}): {purpose}"
-                    if pk:
-                        table_doc += " [PRIMARY KEY]"
-                    if not_null:
-                        table_doc += " [NOT NULL]"
-                    table_doc += "\n"
-
-                # Add relationships
-                if foreign_keys:
-                    table_doc += "\n#### Relationships:\n"
-                    for fk in foreign_keys:
-                        table_doc += f"- {fk[3]} references {fk[2]}.{fk[4]}\n"
-
-                # Add sample data analysis
-                if sample_rows:
-                    table_doc += f"\n#### Sample Data Patterns:\n"
-                    table_doc += SemanticDatabaseHelpers._analyze_sample_data(columns, sample_rows)
-
-                semantic_docs.append(table_doc)
-
-            # Detect business domain and add domain-specific insights
-            domain_analysis = SemanticDatabaseHelpers._analyze_business_domain(tables, semantic_docs)
-            semantic_docs.append(f"\n## Business Domain Analysis\n{domain_analysis}")
-
-            # Create a comprehensive semantic document
-            full_semantic_doc = "\n".join(semantic_docs)
-
-            # Create vector store and upload semantic understanding
-            vector_store = client.vector_stores.create(
-                name=f"Semantic DB: {db_name}",
-                expires_after={"anchor": "last_active_at", "days": 30}  # Auto-cleanup after 30 days
-            )
-
-            # Create temporary file with semantic documentation
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as temp_file:
-                temp_file.write(full_semantic_doc)
-                temp_file_path = temp_file.name
+"""]
+        for col, col_name_lower in zip(columns, col_names_lower):
+            col_name, col_type, not_null, default, pk = col[1], col[2], col[3], col[4], col[5]
+            purpose = SemanticDatabaseHelpers._infer_column_purpose(col_name_lower, col_type)
+            table_doc.append(f"- **{col_name}** ({col_type}): {purpose}")
+            if pk:
+                table_doc.append(" [PRIMARY KEY]")
+            if not_null:
+                table_doc.append(" [NOT NULL]")
+            table_doc.append("\n")
+
+        # Add relationships
+        if foreign_keys:
+            table_doc.append("\n#### Relationships:\n")
+            for fk in foreign_keys:
+                table_doc.append(f"- {fk[3]} references {fk[2]}.{fk[4]}\n")
+
+        # Add sample data analysis
+        if sample_rows:
+            table_doc.append("\n#### Sample Data Patterns:\n")
+            table_doc.append(SemanticDatabaseHelpers._analyze_sample_data(columns, sample_rows))
+
+        return "".join(table_doc)
 
+    @staticmethod
+    def _delete_openai_resources(client: OpenAI, vector_store_id: Optional[str], file_id: Optional[str]) -> None:
+        """Best-effort removal of a vector store and uploaded file left behind by a failed upload"""
+        if vector_store_id:
             try:
-                # Upload file to vector store
-                with open(temp_file_path, 'rb') as file_stream:
-                    file_upload = client.files.create(
-                        file=file_stream,
-                        purpose='assistants'
-                    )
-
-                # Add file to vector store
-                client.vector_stores.files.create(
-                    vector_store_id=vector_store.id,
-                    file_id=file_upload.id
-                )
-
-                # Cache the vector store information
-                SemanticDatabaseHelpers._vector_store_cache[cache_key] = {
-                    'vector_store_id': vector_store.id,
-                    'created_at': datetime.now().isoformat(),
-                    'file_id': file_upload.id,
-                    'db_name': db_name,
-                    'tables': tables,
-                    'semantic_doc_length': len(full_semantic_doc)
-                }
-
-                # Also update traditional cache
-                SemanticDatabaseHelpers._schema_cache[cache_key] = {
-                    'discovered_at': datetime.now().isoformat(),
-                    'tables': {table: {'row_count': 0} for table in tables},  # Simplified for this version
-                    'vector_store_id': vector_store.id
-                }
-
-                SemanticDatabaseHelpers._save_cache_to_disk()
-
-                return f"""Semantic understanding created successfully for {db_path}
-
-Vector Store ID: {vector_store.id}
-Tables analyzed: {len(tables)}
-Semantic document size: {len(full_semantic_doc)} characters
-File ID: {file_upload.id}
-
-The database semantic knowledge is now available for intelligent querying and analysis."""
-
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
-
-            conn.close()
+                client.vector_stores.delete(vector_store_id)
+            except Exception:
+                pass
+        if file_id:
+            try:
+                client.files.delete(file_id)
+            except Exception:
+                pass
 
-        except Exception as e:
-            return f"Error creating semantic understanding for {db_path}: {str(e)}"
+    @staticmethod
+    async def _adelete_openai_resources(client: AsyncOpenAI, vector_store_id: Optional[str], file_id: Optional[str]) -> None:
+        """Async version of _delete_openai_resources"""
+        if vector_store_id:
+            try:
+                await client.vector_stores.delete(vector_store_id)
+            except Exception:
+                pass
+        if file_id:
+            try:
+                await client.files.delete(file_id)
+            except Exception:
+                pass
 
     @staticmethod
     def get_semantic_context(db_path: str, natural_language_query: str) -> str:
@@ -349,10 +581,75 @@ The database semantic knowledge is now available for intelligent querying and an
 
     # Helper methods for semantic analysis
     @staticmethod
-    def _infer_table_purpose(table_name: str, columns: List) -> str:
-        """Infer the business purpose of a table based on name and columns"""
-        name_lower = table_name.lower()
-        col_names = [col[1].lower() for col in columns]
+    def _quote_identifier(name: str) -> str:
+        """Quote a table name for use in SQL, since identifiers can't be bound as parameters"""
+        return '"' + name.replace('"', '""') + '"'
+
+    @staticmethod
+    def _configure_connection(conn: sqlite3.Connection) -> None:
+        """Tune a connection for introspection reads: memory-mapped I/O and a larger page cache"""
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    @staticmethod
+    def _optimize_connection(conn: sqlite3.Connection) -> None:
+        """Let SQLite refresh stale query planner statistics (skipped if the database is read-only)"""
+        try:
+            conn.execute("PRAGMA analysis_limit=400")
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _get_table_metadata(cursor: sqlite3.Cursor) -> Tuple[Dict[str, List], Dict[str, List]]:
+        """Fetch PRAGMA table_info and foreign_key_list rows for all tables in two queries"""
+        table_columns: Dict[str, List] = {}
+        cursor.execute(
+            'SELECT m.name, ti.cid, ti.name, ti.type, ti."notnull", ti.dflt_value, ti.pk '
+            "FROM sqlite_master m JOIN pragma_table_info(m.name) ti "
+            "WHERE m.type='table' AND m.name NOT LIKE 'sqlite\\_%' ESCAPE '\\' ORDER BY m.name, ti.cid"
+        )
+        for table, *column in cursor.fetchall():
+            table_columns.setdefault(table, []).append(tuple(column))
+
+        table_foreign_keys: Dict[str, List] = {}
+        cursor.execute(
+            'SELECT m.name, fk.id, fk.seq, fk."table", fk."from", fk."to", fk.on_update, fk.on_delete, fk."match" '
+            "FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) fk "
+            "WHERE m.type='table' AND m.name NOT LIKE 'sqlite\\_%' ESCAPE '\\' ORDER BY m.name, fk.id, fk.seq"
+        )
+        for table, *foreign_key in cursor.fetchall():
+            table_foreign_keys.setdefault(table, []).append(tuple(foreign_key))
+
+        return table_columns, table_foreign_keys
+
+    @staticmethod
+    def _get_row_counts(cursor: sqlite3.Cursor, tables: List[str]) -> Dict[str, str]:
+        """
+        Get row counts for display. Tables with sqlite_stat1 statistics get the ANALYZE
+        estimate, labelled as such since it can be stale; the rest get an exact COUNT(*).
+        """
+        row_counts: Dict[str, str] = {}
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'")
+        if cursor.fetchone():
+            # the first number in each stat is the number of rows in the table (or index)
+            cursor.execute("SELECT tbl, MAX(CAST(stat AS INTEGER)) FROM sqlite_stat1 GROUP BY tbl")
+            row_counts = {
+                table: f"~{count} (estimate from ANALYZE)"
+                for table, count in cursor.fetchall() if count is not None
+            }
+
+        for table in tables:
+            if table not in row_counts:
+                cursor.execute(f"SELECT COUNT(*) FROM {SemanticDatabaseHelpers._quote_identifier(table)}")
+                row_counts[table] = str(cursor.fetchone()[0])
+        return row_counts
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _infer_table_purpose(table_name: str, name_lower: str, col_names: Tuple[str, ...]) -> str:
+        """Infer the business purpose of a table based on its name and column names (both already lowercased)"""
 
         if any(word in name_lower for word in ['user', 'customer', 'client']):
             return "Stores information about users/customers"
@@ -368,9 +665,10 @@ The database semantic knowledge is now available for intelligent querying and an
             return f"Data table for {table_name} operations"
 
     @staticmethod
-    def _infer_column_purpose(col_name: str, col_type: str) -> str:
-        """Infer the purpose of a column based on name and type"""
-        name_lower = col_name.lower()
+    @functools.lru_cache(maxsize=4096)
+    def _infer_column_purpose(name_lower: str, col_type: str) -> str:
+        """Infer the purpose of a column based on its lowercased name and type"""
+        type_upper = col_type.upper()
 
         if name_lower.endswith('_id') or name_lower == 'id':
             return "Unique identifier"
@@ -388,11 +686,11 @@ The database semantic knowledge is now available for intelligent querying and an
             return "Address information"
         elif 'status' in name_lower:
             return "Status/state indicator"
-        elif col_type.upper() in ['TEXT', 'VARCHAR']:
+        elif type_upper in ['TEXT', 'VARCHAR']:
             return "Text/string data"
-        elif col_type.upper() in ['INTEGER', 'INT']:
+        elif type_upper in ['INTEGER', 'INT']:
             return "Numeric value"
-        elif col_type.upper() in ['REAL', 'DECIMAL', 'FLOAT']:
+        elif type_upper in ['REAL', 'DECIMAL', 'FLOAT']:
             return "Decimal/floating point number"
         else:
             return f"{col_type} field"
@@ -403,45 +701,44 @@ The database semantic knowledge is now available for intelligent querying and an
         if not sample_rows:
             return "No sample data available"
 
-        analysis = f"Sample of {len(sample_rows)} rows:\n"
-        col_names = [col[1] for col in columns]
+        row_count = len(sample_rows)
+        analysis = [f"Sample of {row_count} rows:\n"]
+
+        # Transpose once so each column's values are walked a single time
+        column_values = list(zip(*sample_rows))
 
         # Look for patterns in the data
-        for i, col_name in enumerate(col_names):
-            values = [str(row[i]) if row[i] is not None else 'NULL' for row in sample_rows]
+        for col, values in zip(columns, column_values):
+            col_name = col[1]
+            values = ['NULL' if value is None else str(value) for value in values]
             unique_values = len(set(values))
 
             if unique_values == 1:
-                analysis += f"  - {col_name}: Constant value ({values[0]})\n"
-            elif unique_values == len(values):
-                analysis += f"  - {col_name}: All unique values\n"
+                analysis.append(f"  - {col_name}: Constant value ({values[0]})\n")
+            elif unique_values == row_count:
+                analysis.append(f"  - {col_name}: All unique values\n")
             else:
-                analysis += f"  - {col_name}: {unique_values} unique values out of {len(values)}\n"
+                analysis.append(f"  - {col_name}: {unique_values} unique values out of {row_count}\n")
 
-        return analysis
+        return "".join(analysis)
 
     @staticmethod
-    def _analyze_business_domain(tables: List[str], semantic_docs: List[str]) -> str:
-        """Analyze and determine the business domain of the database"""
-        all_text = " ".join(tables + semantic_docs).lower()
-
-        domains = {
-            'ecommerce': ['order', 'customer', 'product', 'cart', 'payment', 'shipping'],
-            'healthcare': ['patient', 'doctor', 'appointment', 'medical', 'treatment'],
-            'education': ['student', 'course', 'grade', 'enrollment', 'teacher'],
-            'finance': ['account', 'transaction', 'balance', 'loan', 'investment'],
-            'hr': ['employee', 'department', 'salary', 'performance', 'attendance']
-        }
+    def _match_domain_keywords(text: str) -> Set[str]:
+        """Find the business domain keywords that appear in a piece of documentation"""
+        return {keyword.lower() for keyword in _DOMAIN_KEYWORD_PATTERN.findall(text)}
 
+    @staticmethod
+    def _analyze_business_domain(matched_keywords: Set[str]) -> str:
+        """Analyze and determine the business domain of the database from the keywords found in its documentation"""
         domain_scores = {}
-        for domain, keywords in domains.items():
-            score = sum(1 for keyword in keywords if keyword in all_text)
+        for domain, keywords in _BUSINESS_DOMAINS.items():
+            score = sum(1 for keyword in keywords if keyword in matched_keywords)
             if score > 0:
                 domain_scores[domain] = score
 
         if domain_scores:
             primary_domain = max(domain_scores, key=domain_scores.get)
-            return f"Primary domain: {primary_domain.title()} (confidence: {domain_scores[primary_domain]}/{len(domains[primary_domain])} keywords matched)"
+            return f"Primary domain: {primary_domain.title()} (confidence: {domain_scores[primary_domain]}/{len(_BUSINESS_DOMAINS[primary_domain])} keywords matched)"
         else:
             return "Domain: General purpose database"
 
@@ -457,6 +754,9 @@ The database semantic knowledge is now available for intelligent querying and an
         :param db_path: Optional path to specific database, or None to clear all
         :return: Confirmation message
         """
+        # Pick up changes saved by other processes so they aren't overwritten below
+        SemanticDatabaseHelpers._load_cache_from_disk()
+
         if db_path:
             cache_key = SemanticDatabaseHelpers._get_cache_key(db_path)
             SemanticDatabaseHelpers._schema_cache.pop(cache_key, None)
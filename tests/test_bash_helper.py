@@ -0,0 +1,164 @@
+import os
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from llmvm.server import bash_helper
+from llmvm.server.bash_helper import (
+    BashSession,
+    BashSessionError,
+    CommandSafetyAssessor,
+    _first_token,
+    _run_process,
+    _run_trusted_batch,
+    execute_bash_command,
+)
+
+
+@pytest.mark.parametrize('command, token', [
+    ("'ls';rm -rf ~", 'ls;rm'),
+    ("'echo'>~/.bashrc", 'echo>~/.bashrc'),
+    ("'cat'&&shutdown now", 'cat&&shutdown'),
+    ('"ls"x', 'lsx'),
+    ("'ls' -la", 'ls'),
+    ('"ls"', 'ls'),
+])
+def test_first_token_quoted_word(command, token):
+    assert _first_token(command) == token
+
+
+@pytest.mark.parametrize('command', [
+    "'ls';rm -rf ~",
+    "'echo'>~/.bashrc",
+    "'cat'&&shutdown now",
+])
+def test_quoted_safe_command_glued_to_more_shell_needs_approval(command):
+    assessor = CommandSafetyAssessor({})
+    assert assessor.needs_approval(command)
+    assert not assessor.is_known_safe(command)
+
+
+def test_pipeline_producer_exits_quietly_on_closed_pipe(tmp_path):
+    returncode, stdout, stderr = _run_process('yes | head -n 2', shell=True, timeout=10, cwd=str(tmp_path))
+    assert returncode == 0
+    assert stdout == b'y\ny\n'
+    assert stderr == b''
+
+
+@pytest.fixture
+def session():
+    session = BashSession()
+    yield session
+    session.close()
+
+
+def test_session_frames_stdout_stderr_and_exit_code(session, tmp_path):
+    returncode, stdout, stderr = session.run("printf 'no newline'; echo oops >&2; exit 3", 10, str(tmp_path))
+    assert returncode == 3
+    assert stdout == b'no newline'
+    assert stderr == b'oops\n'
+
+    # a fake sentinel without the session token is just output
+    returncode, stdout, _ = session.run(r"printf '\036deadbeef:0\036'; false", 10, str(tmp_path))
+    assert returncode == 1
+    assert stdout == b'\x1edeadbeef:0\x1e'
+
+
+def test_session_exit_only_ends_the_command(session, tmp_path):
+    assert session.run('exit 7', 10, str(tmp_path))[0] == 7
+    assert session.alive
+    assert session.run('echo still here', 10, str(tmp_path)) == (0, b'still here\n', b'')
+
+
+def test_session_does_not_carry_shell_state_between_commands(session, tmp_path):
+    session.run('echo ok && ls() { echo HIJACKED; }', 10, str(tmp_path))
+    _, stdout, _ = session.run('ls -la', 10, str(tmp_path))
+    assert b'HIJACKED' not in stdout
+
+    session.run('set -e; export LEAK=1; cd /', 10, str(tmp_path))
+    assert session.run('false; echo after "$LEAK"; pwd', 10, str(tmp_path)) == (
+        0, f'after \n{tmp_path}\n'.encode(), b''
+    )
+
+
+def test_session_timeout_closes_session(session, tmp_path):
+    with pytest.raises(subprocess.TimeoutExpired):
+        session.run('sleep 5', 0.2, str(tmp_path))
+    assert not session.alive
+    with pytest.raises(BashSessionError):
+        session.run('echo hi', 10, str(tmp_path))
+
+
+def test_session_reports_shell_death(session, tmp_path):
+    returncode, _, _ = session.run('kill -9 $$', 10, str(tmp_path))
+    assert returncode == -9
+    assert not session.alive
+    with pytest.raises(BashSessionError):
+        session.run('echo hi', 10, str(tmp_path))
+
+
+def test_execute_bash_command_runs_approved_commands_in_session(session, tmp_path):
+    class Approve:
+        session_approvals = False
+
+        def request_approval(self, command, cwd, justification=None):
+            return True
+
+    result = execute_bash_command('mkdir made && echo $BASH_VERSION', cwd=str(tmp_path),
+                                  approval_mode='on_request', approval_system=Approve(), session=session)
+    assert result.exit_code == 0
+    # BASH_VERSION is only set in the session's bash, not the one-shot /bin/sh
+    assert result.stdout.strip()
+    assert (tmp_path / 'made').is_dir()
+
+
+def test_batch_splits_output_and_exit_codes_in_order(tmp_path):
+    results = _run_trusted_batch(
+        ['echo one', "printf 'two'; echo err >&2; exit 4", 'echo three'], 10000, str(tmp_path)
+    )
+    assert [(r.command, r.stdout, r.stderr, r.exit_code) for r in results] == [
+        ('echo one', 'one\n', '', 0),
+        ("printf 'two'; echo err >&2; exit 4", 'two', 'err\n', 4),
+        ('echo three', 'three\n', '', 0),
+    ]
+
+
+def test_batch_output_cannot_forge_another_commands_frame(tmp_path):
+    results = _run_trusted_batch([r"printf '\0361:0\036\0361\036'; exit 2", 'false'], 10000, str(tmp_path))
+    assert [r.exit_code for r in results] == [2, 1]
+    assert results[0].stdout == '\x1e1:0\x1e\x1e1\x1e'
+    assert results[1].stdout == ''
+
+
+def test_batch_timeout_marks_unfinished_commands(tmp_path):
+    results = _run_trusted_batch(['echo done', 'sleep 5', 'echo never'], 500, str(tmp_path))
+    assert (results[0].stdout, results[0].exit_code) == ('done\n', 0)
+    assert [r.exit_code for r in results[1:]] == [124, 124]
+    assert results[2].stdout == ''
+
+
+@pytest.mark.parametrize('command', ['ls', 'ls | cat'])
+def test_missing_cwd_reports_the_same_error_on_every_path(command, tmp_path):
+    missing = str(tmp_path / 'missing')
+    result = execute_bash_command(command, cwd=missing, approval_mode='never')
+    assert (result.exit_code, result.stderr) == (1, f'Execution error: working directory does not exist: {missing}')
+
+
+def test_interrupted_run_process_kills_and_reaps_child(tmp_path, monkeypatch):
+    pid_file = tmp_path / 'pid'
+
+    def interrupted_select(*args):
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            time.sleep(0.01)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(bash_helper.select, 'select', interrupted_select)
+    with pytest.raises(KeyboardInterrupt):
+        _run_process(f'echo $$ > {pid_file}; exec sleep 30', shell=True, timeout=10, cwd=str(tmp_path))
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)